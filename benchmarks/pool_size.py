@@ -0,0 +1,89 @@
+"""
+Throughput of sync and async clients depending on connection pool size.
+
+Local stub server emulates Jenkins API with fixed latency, every client runs
+same amount of requests with high concurrency, so small pool makes requests
+wait for free connection.
+
+Usage:
+
+    python benchmarks/pool_size.py [--requests 500] [--concurrency 32]
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ujenkins import AsyncJenkinsClient, JenkinsClient
+
+LATENCY = 0.01
+BODY = b'{"number": 1, "building": false, "result": "SUCCESS"}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_sync(url: str, limit: int, requests: int, concurrency: int) -> float:
+    client = JenkinsClient(url, pool={'limit': limit})
+    client.crumb = False
+
+    started = time.monotonic()
+    client.map(lambda x: client.builds.get_info('job', x), range(requests),
+               concurrency=concurrency)
+    elapsed = time.monotonic() - started
+
+    client.close()
+    return requests / elapsed
+
+
+async def run_async(url: str, limit: int, requests: int, concurrency: int) -> float:
+    client = AsyncJenkinsClient(url, pool={'limit': limit})
+    client.crumb = False
+
+    started = time.monotonic()
+    await client.map(lambda x: client.builds.get_info('job', x), range(requests),
+                     concurrency=concurrency)
+    elapsed = time.monotonic() - started
+
+    await client.close()
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    print(f'{"pool":>6} {"sync rps":>10} {"async rps":>10}')
+
+    for limit in (1, 2, 4, 8, 16, 32):
+        sync_rps = run_sync(url, limit, args.requests, args.concurrency)
+        async_rps = asyncio.run(run_async(url, limit, args.requests, args.concurrency))
+        print(f'{limit:>6} {sync_rps:>10.0f} {async_rps:>10.0f}')
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import pytest
 from aioresponses import aioresponses
 
 from ujenkins import AsyncJenkinsClient, JenkinsClient
+from ujenkins.cache import ResponseCache
 
 
 @pytest.fixture
@@ -20,6 +21,15 @@ def client():
     j.close()
 
 
+@pytest.fixture
+def cached_client():
+    j = JenkinsClient('http://server', cache=ResponseCache(rules={r'/consoleText$': 0}))
+    # disable crumb wrapper for simplify testing
+    j.crumb = False
+    yield j
+    j.close()
+
+
 @pytest.fixture
 async def async_client():
     j = AsyncJenkinsClient('http://server')
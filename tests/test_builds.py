@@ -1,10 +1,21 @@
+import asyncio
+import io
 import json
 import re
+import time
+import zipfile
+
+from urllib.parse import unquote
 
 import pytest
+import requests
 import responses
 
+from aioresponses import CallbackResult
+
 from tests.test_builds_response import filter_builds_response
+from ujenkins import AsyncJenkinsClient, JenkinsClient
+from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
 
 BUILD_INFO_JSON = """{
   "_class" : "hudson.model.FreeStyleBuild",
@@ -130,6 +141,161 @@ def test_get(client, args, kwargs, mock_body, expectations):
         assert request_url == expectations['request_url']
 
 
+def _builds_page(url: str, numbers: list) -> str:
+    # aioresponses passes URL quoted twice
+    match = re.search(r'\{(\d+),(\d+)\}', unquote(unquote(url)))
+    assert match is not None
+
+    start, end = map(int, match.groups())
+    return json.dumps({'allBuilds': [{'number': n} for n in numbers[start:end]]})
+
+
+@responses.activate
+def test_iter(client):
+    numbers = list(range(25, 0, -1))
+
+    def callback(request):
+        body = _builds_page(request.url, numbers)
+        # new build started during iteration
+        numbers.insert(0, 26)
+        return 200, {}, body
+
+    responses.add_callback(responses.GET, re.compile(r'.*/job/job/api/json'), callback=callback)
+
+    builds = [b['number'] for b in client.builds.iter('job', fields=['url'], page_size=10)]
+
+    assert builds == list(range(25, 0, -1))
+    assert len(responses.calls) == 3
+    assert 'tree=allBuilds[number,url]{0,10}' in unquote(responses.calls[0].request.url)
+
+    with pytest.raises(JenkinsError):
+        client.builds.iter('job', page_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_iter(aiohttp_mock, async_client):
+    numbers = list(range(20, 0, -1))
+
+    def callback(url, **_):
+        return CallbackResult(body=_builds_page(str(url), numbers))
+
+    aiohttp_mock.get(re.compile(r'.*/job/job/api/json'), callback=callback, repeat=True)
+
+    builds = [b async for b in async_client.builds.iter('job', page_size=10, prefetch=True)]
+    assert [b['number'] for b in builds] == numbers
+
+    # stop before prefetched page is consumed
+    async for _ in async_client.builds.iter('job', page_size=5, prefetch=True):
+        break
+
+
+def _builds_state(*builds: tuple) -> dict:
+    now = int(time.time() * 1000)
+
+    return {
+        'lastBuild': {'number': max(b[0] for b in builds)},
+        'allBuilds': [{
+            'number': number,
+            'building': building,
+            'result': None if building else 'SUCCESS',
+            'duration': 0,
+            'estimatedDuration': 10,
+            'timestamp': now,
+        } for number, building in builds],
+    }
+
+
+@responses.activate
+def test_wait(client):
+    url = re.compile(r'.*/job/job/api/json')
+    responses.add(responses.GET, url, json=_builds_state((2, True), (1, False)))
+    responses.add(responses.GET, url, json=_builds_state((2, False), (1, False)))
+
+    build = client.builds.wait('job', 2, interval=0.01, max_interval=0.01)
+
+    assert build['result'] == 'SUCCESS'
+    assert len(responses.calls) == 2
+    assert unquote(responses.calls[0].request.url).endswith(
+        'tree=lastBuild[number],allBuilds[number,building,result,duration,'
+        'estimatedDuration,timestamp]{0,10}'
+    )
+
+    with pytest.raises(JenkinsNotFoundError):
+        client.builds.wait('job', 3)
+
+
+@responses.activate
+def test_wait_timeout(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/job/api/json'),
+        json=_builds_state((1, True)),
+    )
+
+    with pytest.raises(JenkinsError, match='Timeout'):
+        client.builds.wait('job', 1, timeout=0.05, interval=0.01)
+
+
+@responses.activate
+def test_wait_fresh(cached_client):
+    url = re.compile(r'.*/job/job/api/json')
+    responses.add(responses.GET, url, json=_builds_state((1, True)))
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, json=_builds_state((1, False)))
+
+    build = cached_client.builds.wait('job', 1, timeout=1, interval=0.01, max_interval=0.01)
+
+    assert build['result'] == 'SUCCESS'
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_wait_retry(aiohttp_mock, async_client):
+    url = re.compile(r'.*/job/job/api/json.*')
+    aiohttp_mock.get(url, payload=_builds_state((2, True), (1, True)))
+    aiohttp_mock.get(url, status=503)
+    aiohttp_mock.get(url, payload=_builds_state((2, False), (1, False)))
+
+    builds = await asyncio.gather(*[
+        async_client.builds.wait('job', build_id, interval=0.01, max_interval=0.01)
+        for build_id in (1, 2)
+    ])
+
+    assert [b['number'] for b in builds] == [1, 2]
+
+    aiohttp_mock.get(url, status=400)
+
+    with pytest.raises(JenkinsError):
+        await async_client.builds.wait('job', 1)
+
+
+@pytest.mark.asyncio
+async def test_async_wait_shared(aiohttp_mock, async_client):
+    states = [
+        _builds_state((3, True), (2, True), (1, False)),
+        _builds_state((3, False), (2, True), (1, False)),
+        _builds_state((3, False), (2, False), (1, False)),
+    ]
+
+    def callback(*_, **__):
+        return CallbackResult(payload=states.pop(0))
+
+    aiohttp_mock.get(re.compile(r'.*/job/job/api/json.*'), callback=callback, repeat=True)
+    aiohttp_mock.get(
+        re.compile(r'.*/job/job/lastBuild/api/json.*'),
+        payload={'number': 3},
+    )
+
+    builds = await asyncio.gather(*[
+        async_client.builds.wait('job', build_id, interval=0.01, max_interval=0.01)
+        for build_id in (1, 2, 3, 'lastBuild')
+    ])
+
+    assert [b['number'] for b in builds] == [1, 2, 3, 3]
+    assert not states
+    assert not async_client._pollers
+
+
 @responses.activate
 def test_get_info(client):
     responses.add(
@@ -142,6 +308,11 @@ def test_get_info(client):
     response = client.builds.get_info('jobbb', 14)
     assert response['duration'] == 6
 
+    client.builds.get_info('jobbb', 14, fields=['result', {'artifacts': 'relativePath'}])
+    assert unquote(responses.calls[1].request.url).endswith(
+        '/14/api/json?tree=result,artifacts[relativePath]'
+    )
+
 
 @responses.activate
 def test_get_output(client):
@@ -156,6 +327,131 @@ def test_get_output(client):
     assert 'Started' in response
 
 
+@responses.activate
+def test_iter_output(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/consoleText'),
+        content_type='text/plain;charset=utf-8',
+        body='Started by user admin\r\nRunning as SYSTEM\nFinished',
+    )
+
+    chunks = list(client.builds.iter_output('job', 14, chunk_size=4))
+    assert len(chunks) > 1
+    assert ''.join(chunks).startswith('Started')
+
+    lines = list(client.builds.iter_output('job', 14, chunk_size=4, lines=True))
+    assert lines == ['Started by user admin', 'Running as SYSTEM', 'Finished']
+
+
+@responses.activate
+def test_iter_output_not_found(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/consoleText'),
+        status=404,
+    )
+
+    with pytest.raises(JenkinsNotFoundError):
+        list(client.builds.iter_output('job', 14))
+
+
+@pytest.mark.asyncio
+async def test_async_iter_output(aiohttp_mock, async_client):
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/consoleText'),
+        content_type='text/plain;charset=utf-8',
+        body='Started by user admin\nRunning as SYSTEM\n',
+    )
+
+    lines = []
+    async for line in async_client.builds.iter_output('job', 14, lines=True):
+        lines.append(line)
+
+    assert lines == ['Started by user admin', 'Running as SYSTEM']
+
+
+@pytest.mark.asyncio
+async def test_async_iter_output_timeout(aiohttp_mock):
+    client = AsyncJenkinsClient('http://server', timeout=5)
+    client.crumb = False
+
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/consoleText'),
+        content_type='text/plain;charset=utf-8',
+        body='Started by user admin\n',
+    )
+
+    async for _ in client.builds.iter_output('job', 14):
+        pass
+
+    timeout = list(aiohttp_mock.requests.values())[0][0].kwargs['timeout']
+
+    assert timeout.total is None
+    assert timeout.sock_connect == 5
+    assert timeout.sock_read == 5
+
+    await client.close()
+
+
+@responses.activate
+def test_tail_output(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/logText/progressiveText'),
+        content_type='text/plain;charset=utf-8',
+        headers={'X-More-Data': 'true', 'X-Text-Size': '9'},
+        body='Started\nRun',
+        match=[responses.matchers.query_param_matcher({'start': '0'})],
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/logText/progressiveText'),
+        content_type='text/plain;charset=utf-8',
+        headers={'X-More-Data': 'true', 'X-Text-Size': '9'},
+        body='',
+        match=[responses.matchers.query_param_matcher({'start': '9'})],
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/logText/progressiveText'),
+        content_type='text/plain;charset=utf-8',
+        headers={'X-Text-Size': '18'},
+        body='ning\nFinished',
+        match=[responses.matchers.query_param_matcher({'start': '9'})],
+    )
+
+    lines = list(client.builds.tail_output('job', 14, lines=True, interval=0))
+
+    assert lines == ['Started', 'Running', 'Finished']
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_tail_output(aiohttp_mock, async_client):
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/logText/progressiveText\?start=0'),
+        content_type='text/plain;charset=utf-8',
+        headers={'X-More-Data': 'true', 'X-Text-Size': '8'},
+        body='Started\n',
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/logText/progressiveText\?start=8'),
+        content_type='text/plain;charset=utf-8',
+        headers={'X-Text-Size': '16'},
+        body='Finished',
+    )
+
+    chunks = []
+    async for chunk in async_client.builds.tail_output('job', 14, interval=0):
+        chunks.append(chunk)
+
+    assert chunks == ['Started\n', 'Finished']
+
+
 @responses.activate
 def test_get_artifact(client):
     responses.add(
@@ -183,6 +479,54 @@ async def test_async_get_artifact(aiohttp_mock, async_client):
     assert len(response) == 3
 
 
+@responses.activate
+def test_download_artifact(client, tmp_path):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        content_type='application/octet-stream',
+        body=b'\x01\x02\x03' * 100,
+    )
+
+    dest = tmp_path / 'file.bin'
+    size = client.builds.download_artifact(
+        'job', 14, 'file.bin', dest, chunk_size=7, preallocate=True
+    )
+
+    assert size == 300
+    assert dest.read_bytes() == b'\x01\x02\x03' * 100
+
+    buffer = io.BytesIO()
+    assert client.builds.download_artifact('job', 14, 'file.bin', buffer) == 300
+    assert buffer.getvalue() == b'\x01\x02\x03' * 100
+
+
+@pytest.mark.asyncio
+async def test_async_download_artifact(aiohttp_mock, async_client, tmp_path):
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        content_type='application/octet-stream',
+        headers={'Content-Length': '3'},
+        body=b'\x01\x02\x03',
+    )
+
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        content_type='application/octet-stream',
+        headers={'Content-Length': '5'},
+        body=b'\x01\x02\x03',
+    )
+
+    dest = tmp_path / 'file.bin'
+    size = await async_client.builds.download_artifact('job', 14, 'file.bin', dest)
+
+    assert size == 3
+    assert dest.read_bytes() == b'\x01\x02\x03'
+
+    with pytest.raises(JenkinsError):
+        await async_client.builds.download_artifact('job', 14, 'file.bin', dest)
+
+
 @responses.activate
 def test_get_list_artifacts(client):
     responses.add(
@@ -200,6 +544,195 @@ def test_get_list_artifacts(client):
     assert artifacts[0]['url'] == 'http://server/job/jobbb/14/artifact/photo.jpg'
 
 
+@responses.activate
+def test_download_artifact_resume(client, tmp_path):
+    dest = tmp_path / 'file.bin'
+    dest.write_bytes(b'\x01\x02\x03')
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        status=206,
+        content_type='application/octet-stream',
+        headers={'Content-Range': 'bytes 3-5/6'},
+        body=b'\x04\x05\x06',
+        match=[responses.matchers.header_matcher({'Range': 'bytes=3-'})],
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        status=416,
+        headers={'Content-Range': 'bytes */6'},
+        match=[responses.matchers.header_matcher({'Range': 'bytes=6-'})],
+    )
+
+    assert client.builds.download_artifact('job', 14, 'file.bin', dest, resume=True) == 6
+    assert dest.read_bytes() == b'\x01\x02\x03\x04\x05\x06'
+
+    assert client.builds.download_artifact('job', 14, 'file.bin', dest, resume=True) == 6
+
+    # local file is bigger than artifact
+    dest.write_bytes(b'\x00' * 7)
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        status=416,
+        headers={'Content-Range': 'bytes */6'},
+        match=[responses.matchers.header_matcher({'Range': 'bytes=7-'})],
+    )
+
+    with pytest.raises(JenkinsError):
+        client.builds.download_artifact('job', 14, 'file.bin', dest, resume=True)
+
+
+@responses.activate
+def test_download_artifact_resume_preallocated(client, tmp_path):
+    dest = tmp_path / 'file.bin'
+    marker = tmp_path / 'file.bin.incomplete'
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/broken.bin'),
+        status=500,
+    )
+
+    with pytest.raises(JenkinsError):
+        client.builds.download_artifact('job', 14, 'broken.bin', dest, preallocate=True)
+
+    assert marker.exists()
+
+    # interrupted download left file extended to full size
+    dest.write_bytes(b'\x01\x02\x00\x00\x00\x00')
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        content_type='application/octet-stream',
+        body=b'\x01\x02\x03\x04\x05\x06',
+    )
+
+    size = client.builds.download_artifact('job', 14, 'file.bin', dest, resume=True)
+
+    assert size == 6
+    assert dest.read_bytes() == b'\x01\x02\x03\x04\x05\x06'
+    assert 'Range' not in responses.calls[-1].request.headers
+    assert not marker.exists()
+
+
+@responses.activate
+def test_download_artifact_retry(tmp_path):
+    client = JenkinsClient('http://server', retry={'total': 2, 'factor': 0})
+    client.crumb = False
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        body=requests.exceptions.ConnectionError(),
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        content_type='application/octet-stream',
+        body=b'\x01\x02\x03',
+    )
+
+    dest = tmp_path / 'file.bin'
+    assert client.builds.download_artifact('job', 14, 'file.bin', dest) == 3
+    assert dest.read_bytes() == b'\x01\x02\x03'
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/artifact/other.bin'),
+        body=requests.exceptions.ConnectionError(),
+    )
+
+    with pytest.raises(JenkinsError):
+        client.builds.download_artifact('job', 14, 'other.bin', tmp_path / 'other.bin')
+
+
+@pytest.mark.asyncio
+async def test_async_download_artifact_segments(aiohttp_mock, async_client, tmp_path):
+    aiohttp_mock.head(
+        re.compile(r'.*/job/.+/artifact/file.bin'),
+        headers={'Content-Length': '6', 'Accept-Ranges': 'bytes'},
+    )
+
+    def callback(_, **kwargs):
+        first, last = map(int, kwargs['headers']['Range'][6:].split('-'))
+        return CallbackResult(
+            status=206,
+            headers={'Content-Range': f'bytes {first}-{last}/6'},
+            body=b'\x01\x02\x03\x04\x05\x06'[first:last + 1],
+        )
+
+    aiohttp_mock.get(re.compile(r'.*/job/.+/artifact/file.bin'), callback=callback, repeat=True)
+
+    dest = tmp_path / 'file.bin'
+    size = await async_client.builds.download_artifact(
+        'job', 14, 'file.bin', dest, segments=3
+    )
+
+    assert size == 6
+    assert dest.read_bytes() == b'\x01\x02\x03\x04\x05\x06'
+
+
+@responses.activate
+def test_download_artifacts(client, tmp_path):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/api/json'),
+        content_type='application/json;charset=utf-8',
+        body=BUILD_INFO_JSON.replace('photo.jpg', 'images/photo.jpg'),
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/jobbb/14/artifact/images/photo.jpg'),
+        content_type='application/octet-stream',
+        body=b'\x01\x02\x03',
+    )
+
+    result = client.builds.download_artifacts(
+        'jobbb', 'lastSuccessfulBuild', tmp_path, include='*.jpg'
+    )
+
+    assert result == {'images/photo.jpg': 3}
+    assert '/lastSuccessfulBuild/' in responses.calls[0].request.url
+    assert responses.calls[0].request.params == {'tree': 'number,artifacts[relativePath]'}
+    assert (tmp_path / 'images' / 'photo.jpg').read_bytes() == b'\x01\x02\x03'
+
+    assert client.builds.download_artifacts('jobbb', 14, tmp_path, include='*.txt') == {}
+
+
+@pytest.mark.asyncio
+async def test_async_download_artifacts_archive(aiohttp_mock, async_client, tmp_path):
+    aiohttp_mock.get(
+        re.compile(r'.*/api/json'),
+        content_type='application/json;charset=utf-8',
+        body=BUILD_INFO_JSON,
+    )
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('archive/photo.jpg', b'\x01\x02\x03')
+        zf.writestr('archive/other.txt', b'skipped')
+
+    aiohttp_mock.get(
+        re.compile(r'.*/job/.+/artifact/\*zip\*/archive.zip'),
+        content_type='application/zip',
+        body=archive.getvalue(),
+    )
+
+    result = await async_client.builds.download_artifacts(
+        'jobbb', 14, tmp_path, archive=True
+    )
+
+    assert result == {'photo.jpg': 3}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['photo.jpg']
+
+
 @responses.activate
 def test_start(client):
     responses.add(
@@ -212,6 +745,35 @@ def test_start(client):
     assert response == 424
 
 
+@pytest.mark.asyncio
+async def test_async_start_and_get_number(aiohttp_mock, async_client):
+    queue_ids = iter(range(1, 4))
+
+    def callback(*_, **__):
+        return CallbackResult(headers={'Location': f'http://server/queue/item/{next(queue_ids)}/'})
+
+    def callback_item(url, **_):
+        queue_id = int(str(url).split('/')[-3])
+        return CallbackResult(payload={'executable': {'number': queue_id + 10, 'url': ''}})
+
+    aiohttp_mock.post(re.compile(r'.*/job/job/build.*'), callback=callback, repeat=True)
+    aiohttp_mock.get(re.compile(r'.*/queue/api/json.*'), payload={'items': [{'id': 3}]})
+    aiohttp_mock.get(re.compile(r'.*/queue/api/json.*'), payload={'items': []})
+    aiohttp_mock.get(re.compile(r'.*/queue/item/.+'), callback=callback_item, repeat=True)
+    aiohttp_mock.get(
+        re.compile(r'.*/job/job/api/json.*'),
+        payload=_builds_state((13, False), (12, False), (11, False)),
+    )
+
+    numbers = await asyncio.gather(*[
+        async_client.builds.start_and_get_number('job', interval=0.01) for _ in range(2)
+    ])
+    assert sorted(numbers) == [11, 12]
+
+    build = await async_client.builds.start_and_wait('job', interval=0.01)
+    assert build['number'] == 13
+
+
 @responses.activate
 def test_start_no_queue_id(client):
     responses.add(
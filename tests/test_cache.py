@@ -0,0 +1,471 @@
+import asyncio
+import os
+import re
+
+import pytest
+import responses
+
+from aioresponses import CallbackResult
+from requests.structures import CaseInsensitiveDict
+
+from tests import JENKINS_INFO_JSON
+from ujenkins import AsyncJenkinsClient, JenkinsClient
+from ujenkins.cache import (
+    BuildCache,
+    CacheEntry,
+    MemoryStorage,
+    Response,
+    ResponseCache,
+    SQLiteStorage,
+)
+from ujenkins.exceptions import JenkinsError
+
+
+@responses.activate
+def test_cache_hit(cached_client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/api/json'),
+        content_type='application/json;charset=utf-8',
+        body=JENKINS_INFO_JSON,
+    )
+
+    status = cached_client.system.get_status()
+    status['mode'] = 'changed'
+
+    assert cached_client.system.get_status()['mode'] == 'NORMAL'
+    assert len(cached_client.views.get()) == 3
+    assert len(responses.calls) == 1
+    assert cached_client.cache.stats == {'hits': 2, 'misses': 1, 'revalidated': 0}
+
+
+@responses.activate
+def test_cache_invalidation(cached_client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/api/json'),
+        content_type='application/json;charset=utf-8',
+        body=JENKINS_INFO_JSON,
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/job/test/doDelete'),
+    )
+
+    responses.add(
+        responses.HEAD,
+        re.compile(r'.+/job/test/1/artifact/file.bin'),
+    )
+
+    cached_client.system.get_status()
+    cached_client.jobs.get_info('test')
+    cached_client._request('HEAD', '/job/test/1/artifact/file.bin')
+    cached_client.system.get_status()
+    cached_client.jobs.get_info('test')
+
+    assert len(responses.calls) == 3
+
+    cached_client.jobs.delete('test')
+    cached_client.system.get_status()
+    cached_client.jobs.get_info('test')
+
+    assert len(responses.calls) == 6
+
+    cached_client.cache.invalidate()
+    cached_client.system.get_status()
+
+    assert len(responses.calls) == 7
+
+
+@responses.activate
+def test_cache_rules(cached_client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.*/job/.+/consoleText'),
+        content_type='text/plain;charset=utf-8',
+        body='Started by user admin',
+    )
+
+    cached_client.builds.get_output('job', 1)
+    cached_client.builds.get_output('job', 1)
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_revalidation():
+    client = JenkinsClient('http://server', cache=ResponseCache(ttl=0))
+    client.crumb = False
+
+    responses.add(
+        responses.GET,
+        'http://server/job/test/config.xml',
+        body='<project/>',
+        headers={'ETag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+    )
+
+    responses.add(
+        responses.GET,
+        'http://server/job/test/config.xml',
+        status=304,
+    )
+
+    assert client.jobs.get_config('test') == '<project/>'
+    assert client.jobs.get_config('test') == '<project/>'
+
+    headers = responses.calls[1].request.headers
+    assert headers['If-None-Match'] == '"abc"'
+    assert headers['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert client.cache.stats == {'hits': 0, 'misses': 2, 'revalidated': 1}
+
+    client.close()
+
+
+@responses.activate
+def test_cache_revalidation_evicted():
+    client = JenkinsClient('http://server', cache=ResponseCache(ttl=0))
+    client.crumb = False
+
+    def callback(request):
+        if 'If-None-Match' not in request.headers:
+            return 200, {'ETag': '"abc"'}, '<project/>'
+
+        # entry is evicted by other thread or process meanwhile
+        client.cache.invalidate()
+        return 304, {}, ''
+
+    responses.add_callback(
+        responses.GET,
+        'http://server/job/test/config.xml',
+        callback=callback,
+    )
+
+    assert client.jobs.get_config('test') == '<project/>'
+    assert client.jobs.get_config('test') == '<project/>'
+
+    assert len(responses.calls) == 3
+    assert 'If-None-Match' not in responses.calls[2].request.headers
+
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_cache_revalidation(aiohttp_mock):
+    client = AsyncJenkinsClient('http://server', cache=ResponseCache(ttl=0))
+    client.crumb = False
+
+    aiohttp_mock.get(
+        'http://server/job/test/1/artifact/file.bin',
+        body=b'content',
+        headers={'ETag': '"abc"'},
+    )
+
+    aiohttp_mock.get(
+        'http://server/job/test/1/artifact/file.bin',
+        status=304,
+    )
+
+    assert await client.builds.get_artifact('test', 1, 'file.bin') == b'content'
+    assert await client.builds.get_artifact('test', 1, 'file.bin') == b'content'
+    assert client.cache.stats['revalidated'] == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_cache_hit(aiohttp_mock):
+    client = AsyncJenkinsClient('http://server', cache=ResponseCache())
+    client.crumb = False
+
+    aiohttp_mock.get(
+        'http://server/api/json',
+        content_type='application/json;charset=utf-8',
+        body=JENKINS_INFO_JSON,
+    )
+
+    assert (await client.system.get_status())['mode'] == 'NORMAL'
+    assert (await client.system.get_status())['mode'] == 'NORMAL'
+    assert client.cache.stats['hits'] == 1
+
+    await client.close()
+
+
+@responses.activate
+def test_build_cache(tmp_path):
+    client = JenkinsClient('http://server', build_cache=BuildCache(tmp_path))
+    client.crumb = False
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/job/job/lastBuild/api/json'),
+        json={'number': 3, 'building': False, 'artifacts': []},
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/job/job/4/api/json'),
+        json={'number': 4, 'building': True, 'artifacts': []},
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/job/job/[34]/consoleText'),
+        body='Finished: SUCCESS',
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/job/job/3/doDelete'),
+    )
+
+    assert client.builds.get_info('job', 'lastBuild')['number'] == 3
+    assert client.builds.get_info('job', 3)['number'] == 3
+    assert client.builds.get_list_artifacts('job', 3) == []
+    assert client.builds.get_output('job', 3) == 'Finished: SUCCESS'
+    assert client.builds.get_output('job', 3) == 'Finished: SUCCESS'
+    assert len(responses.calls) == 2
+
+    # running build is never cached
+    client.builds.get_info('job', 4)
+    client.builds.get_output('job', 4)
+    client.builds.get_output('job', 4)
+    assert len(responses.calls) == 7
+
+    # survives between clients using disk storage
+    client.close()
+    client = JenkinsClient('http://server', build_cache=BuildCache(tmp_path))
+    client.crumb = False
+
+    assert client.builds.get_output('job', 3) == 'Finished: SUCCESS'
+    assert len(responses.calls) == 7
+
+    assert client.build_cache.get('http://server/job/job', 3, 'info') is not None
+
+    client.builds.delete('job', 3)
+    assert client.build_cache.get('http://server/job/job', 3, 'output') is None
+    assert client.build_cache.get('http://server/job/job', 3, 'info') is None
+
+    client.close()
+
+
+@responses.activate
+def test_build_cache_shared(tmp_path):
+    for host in ('a', 'b'):
+        responses.add(
+            responses.GET,
+            f'http://{host}/job/job/1/api/json',
+            json={'number': 1, 'building': False, 'url': host},
+        )
+
+    cache = BuildCache(tmp_path)
+
+    for host in ('a', 'b'):
+        client = JenkinsClient(f'http://{host}', build_cache=cache)
+        client.crumb = False
+
+        assert client.builds.get_info('job', 1)['url'] == host
+
+        client.close()
+
+    assert len(responses.calls) == 2
+    assert len(os.listdir(tmp_path)) == 2
+    assert BuildCache().memory.max_bytes is not None
+
+
+@pytest.mark.asyncio
+async def test_async_build_cache(aiohttp_mock):
+    client = AsyncJenkinsClient('http://server', build_cache=BuildCache())
+    client.crumb = False
+
+    aiohttp_mock.get(
+        'http://server/job/job/lastBuild/api/json?tree=number%2Cbuilding',
+        payload={'number': 3, 'building': False},
+    )
+
+    aiohttp_mock.get(
+        'http://server/job/job/3/consoleText',
+        body='Finished: SUCCESS',
+    )
+
+    assert await client.builds.get_output('job', 'lastBuild') == 'Finished: SUCCESS'
+    assert await client.builds.get_output('job', 3) == 'Finished: SUCCESS'
+    assert client.build_cache.stats['hits'] == 1
+
+    await client.close()
+
+
+def test_memory_storage_eviction():
+    storage = MemoryStorage(max_entries=2, max_bytes=10)
+
+    storage.set('a', CacheEntry(None, 0, 4))
+    storage.set('b', CacheEntry(None, 0, 4))
+    storage.get('a')
+    storage.set('c', CacheEntry(None, 0, 4))
+
+    assert sorted(storage.keys()) == ['a', 'c']
+    assert storage.size == 8
+
+    storage.set('d', CacheEntry(None, 0, 11))
+    assert len(storage) == 2
+
+    storage.set('d', CacheEntry(None, 0, 6))
+    assert list(storage.keys()) == ['c', 'd']
+
+    with pytest.raises(JenkinsError):
+        MemoryStorage(max_entries=0)
+
+
+@responses.activate
+def test_sqlite_storage_shared(tmp_path):
+    responses.add(
+        responses.GET,
+        'http://server/api/json',
+        content_type='application/json;charset=utf-8',
+        body=JENKINS_INFO_JSON,
+    )
+
+    # two clients like two separate processes
+    for _ in range(2):
+        storage = SQLiteStorage(tmp_path / 'cache.db')
+        client = JenkinsClient('http://server', cache=ResponseCache(storage=storage))
+        client.crumb = False
+
+        assert client.system.get_status()['mode'] == 'NORMAL'
+
+        client.close()
+        storage.close()
+
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_sqlite_storage_crumb(tmp_path):
+    for crumb in ('c1', 'c2'):
+        responses.add(
+            responses.GET,
+            'http://server/crumbIssuer/api/json',
+            json={'crumbRequestField': 'Jenkins-Crumb', 'crumb': crumb},
+        )
+
+        responses.add(
+            responses.POST,
+            'http://server/job/test/enable',
+            match=[responses.matchers.header_matcher({'Jenkins-Crumb': crumb})],
+        )
+
+    for crumb in ('c1', 'c2'):
+        storage = SQLiteStorage(tmp_path / 'cache.db')
+        client = JenkinsClient('http://server', cache=ResponseCache(ttl=300, storage=storage))
+
+        assert client.jobs.enable('test') is None
+        assert client.crumb == {'Jenkins-Crumb': crumb}
+        assert len(storage) == 0
+
+        client.close()
+        storage.close()
+
+
+def test_sqlite_storage_eviction(tmp_path):
+    storage = SQLiteStorage(tmp_path / 'cache.db', max_entries=2, max_bytes=10)
+
+    def entry(size: int) -> CacheEntry:
+        response = Response(200, CaseInsensitiveDict({'ETag': 'x'}), b'x' * size)
+        return CacheEntry(response, 0, size)
+
+    storage.set('a', entry(4))
+    storage.set('b', entry(4))
+    storage.get('a')
+    storage.set('c', entry(4))
+
+    assert sorted(storage.keys()) == ['a', 'c']
+    assert storage.size == 8
+
+    storage.set('d', entry(11))
+    assert len(storage) == 2
+
+    storage.set('d', entry(6))
+    assert sorted(storage.keys()) == ['c', 'd']
+
+    cached = storage.get('d')
+    assert cached is not None
+    assert cached.response.content == b'xxxxxx'
+    assert cached.response.headers['etag'] == 'x'
+
+    storage.delete('d')
+    storage.clear()
+    assert len(storage) == 0
+
+    storage.close()
+
+
+def test_make_key():
+    assert ResponseCache.make_key('/api/json') == '/api/json'
+    assert ResponseCache.make_key('/api/json', {'b': 1, 'a': 2}) == '/api/json?a=2&b=1'
+    assert ResponseCache.make_key('/api/json?depth=1', {'a': 2}) == '/api/json?depth=1&a=2'
+
+
+@pytest.mark.asyncio
+async def test_async_cache_invalidation_concurrent(aiohttp_mock):
+    client = AsyncJenkinsClient('http://server', cache=ResponseCache(ttl=60))
+    client.crumb = False
+
+    state = {'temporarilyOffline': False}
+
+    def get(*_, **__):
+        return CallbackResult(payload=dict(state))
+
+    async def toggle(*_, **__):
+        await asyncio.sleep(0.05)
+        state['temporarilyOffline'] = True
+        return CallbackResult(content_type='text/plain')
+
+    aiohttp_mock.get(re.compile(r'.+/computer/n/api/json.*'), callback=get, repeat=True)
+    aiohttp_mock.post(re.compile(r'.+/computer/n/toggleOffline.*'), callback=toggle)
+
+    async def get_info():
+        # made while toggle request is in flight
+        await asyncio.sleep(0.01)
+        return await client.nodes.get_info('n', fields='temporarilyOffline')
+
+    _, info = await asyncio.gather(client.nodes.disable('n'), get_info())
+    assert info == {'temporarilyOffline': False}
+
+    info = await client.nodes.get_info('n', fields='temporarilyOffline')
+    assert info == {'temporarilyOffline': True}
+
+    await client.close()
+
+
+@responses.activate
+def test_cache_crumb_refresh():
+    for crumb in ('c1', 'c2'):
+        responses.add(
+            responses.GET,
+            re.compile(r'.+/crumbIssuer/api/json'),
+            json={'crumbRequestField': 'Jenkins-Crumb', 'crumb': crumb},
+        )
+
+    # session is expired after first request
+    for status in (200, 403):
+        responses.add(
+            responses.POST,
+            re.compile(r'.+/job/test/enable'),
+            status=status,
+            match=[responses.matchers.header_matcher({'Jenkins-Crumb': 'c1'})],
+        )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/job/test/enable'),
+        match=[responses.matchers.header_matcher({'Jenkins-Crumb': 'c2'})],
+    )
+
+    client = JenkinsClient('http://server', cache=ResponseCache(ttl=300))
+
+    assert client.jobs.enable('test') is None
+    assert client.crumb == {'Jenkins-Crumb': 'c1'}
+
+    assert client.jobs.enable('test') is None
+    assert client.crumb == {'Jenkins-Crumb': 'c2'}
+    assert len(client.cache.storage) == 0
@@ -1,12 +1,27 @@
+import asyncio
+import gzip
+import json
 import re
+import time
+import zlib
 
 from http import HTTPStatus
 
 import aiohttp
 import pytest
+import requests
 import responses
 
-from ujenkins import AsyncJenkinsClient, JenkinsClient, JenkinsError
+from requests.structures import CaseInsensitiveDict
+
+from ujenkins import (
+    AsyncJenkinsClient,
+    JenkinsClient,
+    JenkinsError,
+    JenkinsNotFoundError,
+)
+from ujenkins.adapters.aio import Decompressor
+from ujenkins.core import Response
 
 CRUMB_JSON = """
 {
@@ -185,3 +200,276 @@ def test_get_folder_and_job_name(client):
     )
     assert folder == 'job/folder/job/subfolder/'
     assert job == 'sub_job_in_subfolder'
+
+
+@pytest.mark.asyncio
+async def test_async_map(aiohttp_mock, async_client):
+    for number in (1, 3):
+        aiohttp_mock.get(
+            f'http://server/job/job/{number}/api/json',
+            content_type='application/json;charset=utf-8',
+            body=f'{{"number": {number}}}',
+        )
+
+    aiohttp_mock.get(
+        'http://server/job/job/2/api/json',
+        status=HTTPStatus.NOT_FOUND,
+    )
+
+    aiohttp_mock.get(
+        'http://server/job/job/4/api/json',
+        exception=aiohttp.ClientConnectionError(),
+    )
+
+    results = await async_client.map(
+        lambda x: async_client.builds.get_info('job', x),
+        [1, 2, 3, 4],
+        concurrency=2,
+    )
+
+    assert results[0] == {'number': 1}
+    assert isinstance(results[1], JenkinsNotFoundError)
+    assert results[2] == {'number': 3}
+    assert isinstance(results[3], JenkinsError)
+
+
+@pytest.mark.asyncio
+async def test_async_as_completed(aiohttp_mock, async_client):
+    for number in (1, 2):
+        aiohttp_mock.get(
+            f'http://server/job/job/{number}/api/json',
+            content_type='application/json;charset=utf-8',
+            body=f'{{"number": {number}}}',
+        )
+
+    results = {}
+    async for item, result in async_client.as_completed(
+        lambda x: async_client.builds.get_info('job', x),
+        [1, 2],
+    ):
+        results[item] = result['number']
+
+    assert results == {1: 1, 2: 2}
+
+    with pytest.raises(JenkinsError):
+        await async_client.map(async_client.builds.get_info, [], concurrency=0)
+
+
+@responses.activate
+def test_sync_map(client):
+    for number in (1, 3):
+        responses.add(
+            responses.GET,
+            f'http://server/job/job/{number}/api/json',
+            content_type='application/json;charset=utf-8',
+            body=f'{{"number": {number}}}',
+        )
+
+    responses.add(
+        responses.GET,
+        'http://server/job/job/2/api/json',
+        status=HTTPStatus.NOT_FOUND,
+    )
+
+    responses.add(
+        responses.GET,
+        'http://server/job/job/4/api/json',
+        body=requests.exceptions.ConnectionError(),
+    )
+
+    results = client.map(
+        lambda x: client.builds.get_info('job', x),
+        [1, 2, 3, 4],
+        concurrency=20,
+    )
+
+    assert results[0] == {'number': 1}
+    assert isinstance(results[1], JenkinsNotFoundError)
+    assert results[2] == {'number': 3}
+    assert isinstance(results[3], JenkinsError)
+    assert client.session.adapters['http://']._pool_maxsize == 20
+
+
+@responses.activate
+def test_sync_as_completed(client):
+    for number in (1, 2):
+        responses.add(
+            responses.GET,
+            f'http://server/job/job/{number}/api/json',
+            content_type='application/json;charset=utf-8',
+            body=f'{{"number": {number}}}',
+        )
+
+    results = {}
+    for item, result in client.as_completed(
+        lambda x: client.builds.get_info('job', x),
+        [1, 2],
+    ):
+        results[item] = result['number']
+
+    assert results == {1: 1, 2: 2}
+
+    with pytest.raises(JenkinsError):
+        client.map(client.builds.get_info, [], concurrency=0)
+
+
+def test_sync_client_pool():
+    client = JenkinsClient('http://server', pool={'limit': 50})
+
+    adapter = client.session.adapters['https://']
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_block is True
+
+    client.map(lambda x: x, [], concurrency=100)
+    assert client.session.adapters['https://']._pool_maxsize == 50
+
+
+@pytest.mark.asyncio
+async def test_async_client_pool():
+    client = AsyncJenkinsClient(
+        'http://server',
+        pool={'limit': 50, 'limit_per_host': 20, 'keepalive_timeout': 60},
+        retry={'total': 2},
+    )
+
+    assert client.session.session.connector.limit == 50
+    assert client.session.session.connector.limit_per_host == 20
+    await client.close()
+
+
+def test_pool_argument_validation():
+    with pytest.raises(JenkinsError):
+        JenkinsClient('http://server', pool={'size': 1})
+
+    with pytest.raises(JenkinsError):
+        JenkinsClient('http://server', pool={'limit': 0})
+
+
+@pytest.mark.asyncio
+async def test_async_compression(aiohttp_mock, async_client):
+    body = json.dumps({'number': 1, 'text': 'x' * 1000}).encode()
+
+    aiohttp_mock.get(
+        'http://server/job/job/1/api/json',
+        content_type='application/json;charset=utf-8',
+        headers={'Content-Encoding': 'gzip'},
+        body=gzip.compress(body),
+    )
+
+    response = await async_client.builds.get_info('job', 1)
+
+    assert response['number'] == 1
+    assert async_client.traffic['decompressed'] == len(body)
+    assert async_client.traffic['compressed'] < len(body)
+
+
+@responses.activate
+def test_sync_compression(client):
+    body = json.dumps({'number': 1, 'text': 'x' * 1000}).encode()
+
+    responses.add(
+        responses.GET,
+        'http://server/job/job/1/api/json',
+        content_type='application/json;charset=utf-8',
+        headers={'Content-Encoding': 'gzip'},
+        body=gzip.compress(body),
+    )
+
+    response = client.builds.get_info('job', 1)
+
+    assert response['number'] == 1
+    assert client.session.headers['Accept-Encoding'].startswith('gzip')
+    assert client.traffic['decompressed'] == len(body)
+    assert client.traffic['compressed'] < len(body)
+
+
+def test_decompressor_deflate():
+    data = b'x' * 1000
+
+    for wbits in (zlib.MAX_WBITS, -zlib.MAX_WBITS):
+        compressor = zlib.compressobj(wbits=wbits)
+        compressed = compressor.compress(data) + compressor.flush()
+
+        decompressor = Decompressor('deflate')
+        result = decompressor.decompress(compressed[:10])
+        result += decompressor.decompress(compressed[10:])
+        result += decompressor.flush()
+
+        assert result == data
+
+    assert Decompressor('identity').decompress(data) == data
+
+
+@responses.activate
+def test_json_loads():
+    responses.add(
+        responses.GET,
+        'http://server/api/json',
+        content_type='application/json;charset=utf-8',
+        body='{"mode": "NORMAL"}',
+    )
+
+    calls = []
+
+    def json_loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    client = JenkinsClient('http://server', json_loads=json_loads)
+    client.crumb = False
+
+    assert client.system.get_status() == {'mode': 'NORMAL'}
+    assert calls == [b'{"mode": "NORMAL"}']
+
+
+@responses.activate
+def test_json_without_text(client, monkeypatch):
+    responses.add(
+        responses.GET,
+        'http://server/api/json',
+        content_type='application/json;charset=utf-8',
+        body='{"mode": "NORMAL"}',
+    )
+
+    def text(_):
+        raise AssertionError('response body must not be decoded')
+
+    monkeypatch.setattr(Response, 'text', property(text))
+
+    assert client.system.get_status() == {'mode': 'NORMAL'}
+
+
+def test_response_text():
+    response = Response(200, CaseInsensitiveDict(), 'привет'.encode('cp1251'), 'cp1251')
+    assert response.text == 'привет'
+    assert Response(200, CaseInsensitiveDict(), b'\xff').text == '\ufffd'
+
+
+@responses.activate
+def test_sync_single_flight(client):
+    def callback(_):
+        time.sleep(0.2)
+        return 200, {'Content-Type': 'application/json'}, '{"mode": "NORMAL"}'
+
+    responses.add_callback(responses.GET, 'http://server/api/json', callback=callback)
+
+    results = client.map(lambda _: client.system.get_status(), range(5))
+
+    assert results == [{'mode': 'NORMAL'}] * 5
+    assert results[0] is not results[1]
+    assert len(responses.calls) == 1
+
+    client.system.get_status()
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight(aiohttp_mock, async_client):
+    aiohttp_mock.get('http://server/api/json', payload={'mode': 'NORMAL'})
+
+    results = await asyncio.gather(*[async_client.system.get_status() for _ in range(5)])
+
+    assert results == [{'mode': 'NORMAL'}] * 5
+    assert results[0] is not results[1]
+    assert len(aiohttp_mock.requests[('GET', aiohttp.client.URL('http://server/api/json'))]) == 1
+    assert not async_client._flights
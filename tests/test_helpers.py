@@ -2,6 +2,8 @@ import pytest
 
 from ujenkins.exceptions import JenkinsError
 from ujenkins.helpers import (
+    TextDecoder,
+    build_tree,
     construct_job_config,
     construct_node_config,
     normalize_url,
@@ -53,3 +55,29 @@ def test_normalize_url():
 
     valid_path = '/folder_name/job/job_name/enable'
     assert normalize_url(valid_path) == '/folder_name/job/job_name/enable'
+
+
+def test_text_decoder():
+    decoder = TextDecoder(lines=True)
+
+    data = 'первая\r\nвторая\nтре'.encode()
+    lines = []
+    for i in range(len(data)):
+        lines.extend(decoder.feed(data[i:i + 1]))
+    lines.extend(decoder.flush())
+
+    assert lines == ['первая', 'вторая', 'тре']
+
+    decoder = TextDecoder()
+    assert decoder.feed('ab'.encode()) == ['ab']
+    assert decoder.feed(b'') == []
+    assert decoder.flush() == []
+
+
+def test_build_tree():
+    assert build_tree('number,url') == 'number,url'
+    assert build_tree(['number', 'result']) == 'number,result'
+    assert build_tree(['id', ['why', None]]) == 'id,why'
+
+    fields = {'jobs{0,10}': ['name', {'lastBuild': 'number', 'color': None}]}
+    assert build_tree(fields) == 'jobs{0,10}[name,lastBuild[number],color]'
@@ -2,9 +2,11 @@ import re
 
 from http import HTTPStatus
 
+import pytest
 import responses
 
 from tests import JENKINS_INFO_JSON
+from ujenkins.exceptions import JenkinsError
 
 JOB_INFO_JSON = """
 {
@@ -202,6 +204,65 @@ def test_get_with_depth(client):
     }
 
 
+def _job(name: str, *children: dict, folder: bool = False) -> dict:
+    job = {'name': name, 'url': f'http://server/job/{name}/'}  # type: dict
+    if children or folder:
+        job['jobs'] = list(children)
+    return job
+
+
+@responses.activate
+def test_walk(client):
+    responses.add(
+        responses.GET,
+        'http://server/api/json',
+        json={'jobs': [
+            _job('job1'),
+            _job('f1', _job('job2'), _job('f2', {'name': 'job3'}), _job('f3', folder=True)),
+        ]},
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'http://server/job/f1/+job/f2/api/json.*'),
+        json={'jobs': [_job('job3')]},
+    )
+
+    jobs = dict(client.jobs.walk(fields=['color'], depth=2))
+
+    assert list(jobs) == ['job1', 'f1', 'f1/job2', 'f1/f2', 'f1/f3', 'f1/f2/job3']
+    assert 'jobs' not in jobs['f1']
+    assert responses.calls[0].request.params == {
+        'tree': 'jobs[name,url,color,jobs[name,url,color,jobs[name]]]'
+    }
+    assert responses.calls[1].request.params == {
+        'tree': 'jobs[name,url,color,jobs[name,url,color,jobs[name]]]'
+    }
+
+    jobs = dict(client.jobs.walk(max_depth=1))
+    assert list(jobs) == ['job1', 'f1']
+    assert responses.calls[2].request.params == {'tree': 'jobs[name,url]'}
+
+    with pytest.raises(JenkinsError):
+        list(client.jobs.walk(depth=0))
+
+
+@pytest.mark.asyncio
+async def test_async_walk_fallback(aiohttp_mock, async_client):
+    aiohttp_mock.get(re.compile(r'http://server/job/f1/api/json.+'), status=500)
+    aiohttp_mock.get(
+        re.compile(r'http://server/job/f1/api/json.+'),
+        payload={'jobs': [_job('f2', {'name': 'job'})]},
+    )
+    aiohttp_mock.get(
+        re.compile(r'http://server/job/f1/+job/f2/api/json.+'),
+        payload={'jobs': [_job('job')]},
+    )
+
+    jobs = [name async for name, _ in async_client.jobs.walk('f1')]
+    assert jobs == ['f1/f2', 'f1/f2/job']
+
+
 @responses.activate
 def test_get_info(client):
     responses.add(
@@ -1,9 +1,11 @@
 import re
 
+from urllib.parse import unquote
+
 import pytest
 import responses
 
-from ujenkins.exceptions import JenkinsError
+from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
 
 NODES_JSON = """{
   "_class" : "hudson.model.ComputerSet",
@@ -246,6 +248,50 @@ def test_get(client):
     response = client.nodes.get()
     assert len(response) == 1
 
+    response = client.nodes.get(fields=['offline'])
+    assert len(response) == 1
+    assert unquote(responses.calls[1].request.url).endswith(
+        '?tree=computer[displayName,offline]'
+    )
+
+
+@responses.activate
+def test_snapshot(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/computer/api/json'),
+        json={'computer': [
+            {
+                'displayName': 'a',
+                'offline': False,
+                'assignedLabels': [{'name': 'a'}, {'name': 'linux'}],
+                'executors': [{'idle': True}, {'idle': False}],
+            },
+            {
+                'displayName': 'b',
+                'offline': True,
+                'assignedLabels': [{'name': 'b'}, {'name': 'linux'}],
+                'executors': [{'idle': True}],
+            },
+        ]},
+    )
+
+    snapshot = client.nodes.snapshot(fields='description')
+
+    assert len(snapshot) == 2
+    assert 'a' in snapshot
+    assert snapshot['b']['offline'] is True
+    assert snapshot.labels['linux'] == ['a', 'b']
+    assert snapshot.offline == ['b']
+    assert snapshot.idle_executors == {'a': 1}
+    assert snapshot.find('linux', min_idle=1) == ['a']
+    assert snapshot.find(offline=True) == ['b']
+    assert snapshot.find('windows') == []
+
+    snapshot.find('linux').clear()
+    assert snapshot.find('linux') == ['a', 'b']
+    assert responses.calls[0].request.params['tree'].endswith('executors[idle],description]')
+
 
 @responses.activate
 def test_get_failed_builds(client):
@@ -317,9 +363,28 @@ def test_is_exists(client):
 def test_create(client):
     responses.add(
         responses.GET,
-        re.compile(r'.+/computer/api/json'),
-        content_type='application/json;charset=utf-8',
-        body=NODES_JSON,
+        re.compile(r'.+/computer/buildbot/api/json'),
+        status=404,
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/computer/tuxbot2/api/json'),
+        json={'displayName': 'tuxbot2'},
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/computer/doCreateItem\?name=tuxbot2.+'),
+        status=400,
+        body='<h1>Error</h1><p>Agent called ‘tuxbot2’ already exists</p>',
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/computer/doCreateItem\?name=bad%2Fbot.+'),
+        status=400,
+        body='<h1>Error</h1><p>‘/’ is an unsafe character</p>',
     )
 
     responses.add(
@@ -328,6 +393,51 @@ def test_create(client):
     )
 
     assert client.nodes.create('buildbot', {}) is None
+    assert responses.calls[0].request.params == {'tree': 'displayName'}
+
+    with pytest.raises(JenkinsError, match='already exists'):
+        client.nodes.create('tuxbot2', {})
+
+    assert client.nodes.create('buildbot', {}, check=False) is None
+    assert len(responses.calls) == 4
+
+    with pytest.raises(JenkinsError, match='already exists'):
+        client.nodes.create('tuxbot2', {}, check=False)
+
+    assert len(responses.calls) == 5
+
+    with pytest.raises(JenkinsError, match='unsafe character') as e:
+        client.nodes.create('bad/bot', {}, check=False)
+
+    assert e.value.status == 400
+
+
+@responses.activate
+def test_create_many(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/computer/agent-\d/api/json'),
+        status=404,
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/computer/doCreateItem\?name=agent-[01].+'),
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/computer/doCreateItem\?name=agent-2.+'),
+        status=400,
+    )
+
+    config = {'numExecutors': 1}
+    result = client.nodes.create_many({f'agent-{i}': config for i in range(3)})
+
+    assert result['agent-0'] is None
+    assert result['agent-1'] is None
+    assert isinstance(result['agent-2'], JenkinsError)
+    assert config == {'numExecutors': 1}
 
 
 @responses.activate
@@ -388,6 +498,7 @@ def test_enable_when_disabled(client):
 
     assert client.nodes.enable('master') is None
     assert len(responses.calls) == 2
+    assert responses.calls[0].request.params == {'tree': 'temporarilyOffline'}
 
 
 @responses.activate
@@ -428,6 +539,68 @@ def test_disable_when_disabled(client):
     assert len(responses.calls) == 1
 
 
+@responses.activate
+def test_set_offline_many(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/computer/api/json'),
+        json={'computer': [
+            {'displayName': 'Built-In Node', 'temporarilyOffline': False},
+            {'displayName': 'agent-1', 'temporarilyOffline': True},
+            {'displayName': 'agent-2', 'temporarilyOffline': False},
+        ]},
+    )
+
+    responses.add(
+        responses.POST,
+        re.compile(r'.+/computer/(\(master\)|agent-2)/toggleOffline'),
+    )
+
+    result = client.nodes.set_offline_many(
+        ['master', 'agent-1', 'agent-2', 'agent-3', 'agent-2', 'Built-In Node'],
+        True,
+        'maintenance',
+    )
+
+    assert len(result) == 5
+    assert result['master'] is None
+    assert result['Built-In Node'] is None
+    assert result['agent-1'] is None
+    assert result['agent-2'] is None
+    assert isinstance(result['agent-3'], JenkinsNotFoundError)
+
+    tree = 'computer[displayName,temporarilyOffline]'
+    assert responses.calls[0].request.params == {'tree': tree}
+    assert len(responses.calls) == 3
+    assert responses.calls[1].request.params == {'offlineMessage': 'maintenance'}
+
+
+@responses.activate
+def test_set_offline_fresh(cached_client):
+    for offline in (False, True):
+        responses.add(
+            responses.GET,
+            re.compile(r'.+/computer/agent-1/api/json'),
+            json={'temporarilyOffline': offline},
+        )
+        responses.add(
+            responses.GET,
+            re.compile(r'.+/computer/api/json'),
+            json={'computer': [{'displayName': 'agent-1', 'temporarilyOffline': offline}]},
+        )
+
+    responses.add(responses.POST, re.compile(r'.+/toggleOffline'))
+
+    # state is cached, then node is disabled by someone else
+    cached_client.nodes.get_info('agent-1', fields='temporarilyOffline')
+    cached_client.nodes.get(fields='temporarilyOffline')
+
+    assert cached_client.nodes.disable('agent-1') is None
+    assert cached_client.nodes.set_offline_many(['agent-1'], True) == {'agent-1': None}
+    assert len(responses.calls) == 4
+    assert all(call.request.method == 'GET' for call in responses.calls)
+
+
 @responses.activate
 def test_update_offline_reason(client):
     responses.add(
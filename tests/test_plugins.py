@@ -1,5 +1,7 @@
 import re
 
+from urllib.parse import unquote
+
 import responses
 
 JENKINS_PLUGINS_JSON = """
@@ -57,3 +59,8 @@ def test_get(client):
     response = client.plugins.get()
     assert len(response) == 1
     assert 'pam-auth' in response
+
+    client.plugins.get(fields=['version', {'dependencies': ['shortName']}])
+    assert unquote(responses.calls[1].request.url).endswith(
+        '?tree=plugins[shortName,version,dependencies[shortName]]'
+    )
@@ -1,7 +1,12 @@
 import re
 
+from itertools import islice
+
+import pytest
 import responses
 
+from ujenkins.exceptions import JenkinsError
+
 QUEUE_JSON = """
 {
   "_class" : "hudson.model.Queue",
@@ -114,3 +119,127 @@ def test_cancel(client):
     )
 
     assert client.queue.cancel(16) is None
+
+
+@responses.activate
+def test_wait(client):
+    url = re.compile(r'.+/queue/api/json')
+    responses.add(responses.GET, url, json={'items': [{'id': 16}]})
+    responses.add(responses.GET, url, json={'items': []})
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/queue/item/16/api/json'),
+        json={'executable': {'number': 10, 'url': 'http://server/job/test/10/'}},
+    )
+
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/queue/item/17/api/json'),
+        json={'cancelled': True, 'executable': None},
+    )
+
+    assert client.queue.wait(16, interval=0.01)['number'] == 10
+    assert len(responses.calls) == 3
+    assert 'tree=items%5Bid%5D' in responses.calls[0].request.url
+
+    with pytest.raises(JenkinsError, match='cancelled'):
+        client.queue.wait(17)
+
+
+@responses.activate
+def test_wait_fresh(cached_client):
+    url = re.compile(r'.+/queue/api/json')
+    responses.add(responses.GET, url, json={'items': [{'id': 16}]})
+    responses.add(responses.GET, url, json={'items': []})
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/queue/item/16/api/json'),
+        json={'executable': {'number': 10, 'url': 'http://server/job/test/10/'}},
+    )
+
+    assert cached_client.queue.get_info(16)['executable']['number'] == 10
+    assert cached_client.queue.wait(16, timeout=1, interval=0.01)['number'] == 10
+    assert len(responses.calls) == 4
+
+    responses.add(responses.GET, url, json={'items': [{'id': 16, 'why': 'A'}]})
+    responses.add(responses.GET, url, json={'items': []})
+
+    events = list(islice(cached_client.queue.watch(interval=0.01), 2))
+
+    assert events[1]['removed'] == {16: {'id': 16, 'why': 'A'}}
+
+
+@responses.activate
+def test_get_many(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/queue/api/json'),
+        json={'items': [{'id': 16, 'why': 'waiting'}]},
+    )
+
+    assert client.queue.get_many([16, 17], fields='why') == {
+        16: {'id': 16, 'why': 'waiting'},
+        17: None,
+    }
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_watch(client):
+    url = re.compile(r'.+/queue/api/json')
+    responses.add(responses.GET, url, json={'items': [{'id': 16, 'why': 'A'}]})
+    responses.add(responses.GET, url, json={'items': [{'id': 16, 'why': 'A'}]})
+    responses.add(responses.GET, url, json={'items': [{'id': 16, 'why': 'B'}, {'id': 17}]})
+    responses.add(responses.GET, url, json={'items': [{'id': 17}]})
+
+    events = list(islice(client.queue.watch(interval=0.01), 3))
+
+    assert events[0] == {'added': {16: {'id': 16, 'why': 'A'}}, 'removed': {}, 'changed': {}}
+    assert events[1] == {
+        'added': {17: {'id': 17}},
+        'removed': {},
+        'changed': {16: {'id': 16, 'why': 'B'}},
+    }
+    assert events[2] == {'added': {}, 'removed': {16: {'id': 16, 'why': 'B'}}, 'changed': {}}
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_watch_countdown(client):
+    url = re.compile(r'.+/queue/api/json')
+    for why in ('In the quiet period. Expires in 4.9 sec',
+                'In the quiet period. Expires in 3 sec',
+                'Waiting for next available executor'):
+        responses.add(responses.GET, url, json={'items': [{'id': 16, 'why': why}]})
+
+    events = list(islice(client.queue.watch(interval=0.01), 2))
+
+    assert events[1]['changed'] == {16: {'id': 16, 'why': 'Waiting for next available executor'}}
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_cancel_many(client):
+    responses.add(
+        responses.GET,
+        re.compile(r'.+/queue/api/json'),
+        json={'items': [
+            {'id': 16, 'task': {'name': 'a'}},
+            {'id': 17, 'task': {'name': 'b'}},
+            {'id': 18, 'task': {'name': 'a'}},
+        ]},
+    )
+
+    responses.add(responses.POST, re.compile(r'.+/queue/cancelItem\?id=1[68]'))
+    responses.add(responses.POST, re.compile(r'.+/queue/cancelItem\?id=19'), status=404)
+
+    result = client.queue.cancel_many(lambda item: item['task']['name'] == 'a')
+
+    assert result == {16: None, 18: None}
+    assert 'params' in responses.calls[0].request.params['tree']
+
+    result = client.queue.cancel_many([16, 19])
+
+    assert result[16] is None
+    assert isinstance(result[19], JenkinsError)
@@ -1 +1,12 @@
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
 CRUMB_ISSUER_URL = '/crumbIssuer/api/json'
+
+# consecutive failed polls of waiting which are retried, e.g. while Jenkins restarts
+POLL_RETRIES = 5
+
+# brotli is decoded by both requests and aiohttp only if package is installed
+ACCEPT_ENCODING = 'gzip, deflate, br' if brotli else 'gzip, deflate'
@@ -1,7 +1,17 @@
 import asyncio
+import zlib
 
 from http import HTTPStatus
-from typing import Any, Callable, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from aiohttp import (
     BasicAuth,
@@ -10,16 +20,81 @@ from aiohttp import (
     ClientSession,
     ClientTimeout,
     CookieJar,
+    TCPConnector,
 )
 
-from ujenkins.adapters import CRUMB_ISSUER_URL
+from ujenkins.adapters import ACCEPT_ENCODING, CRUMB_ISSUER_URL, POLL_RETRIES, brotli
+from ujenkins.cache import BuildCache, ResponseCache
 from ujenkins.core import Jenkins, Response
 from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from ujenkins.helpers import StreamTransform
+
+CHUNK_SIZE = 64 * 1024
+
+
+class Decompressor:
+    """
+    Incremental decoder of HTTP response body by Content-Encoding header.
+    """
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding.strip().lower()
+        self.decoder = None  # type: Any
+
+        if self.encoding == 'gzip':
+            self.decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == 'br':
+            if brotli is None:
+                raise JenkinsError('Install `brotli` package to decode response')
+            self.decoder = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self.encoding == 'deflate' and self.decoder is None:
+            # some servers send raw deflate stream without zlib header
+            if chunk and chunk[0] & 0x0F == 8:
+                self.decoder = zlib.decompressobj()
+            else:
+                self.decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+
+        if self.decoder is None:
+            return chunk
+
+        if self.encoding == 'br':
+            return self.decoder.process(chunk)
+
+        return self.decoder.decompress(chunk)
+
+    def flush(self) -> bytes:
+        if self.decoder is None or self.encoding == 'br':
+            return b''
+
+        return self.decoder.flush()
+
+
+def _create_session(pool: Optional[dict], compression: bool) -> ClientSession:
+    # use unsafe cookie jar to be the same as requests package and add
+    # possibility to use password instead of tokens
+    # https://github.com/pbelskiy/ujenkins/issues/11
+    kwargs = {
+        'cookie_jar': CookieJar(unsafe=True),
+        'headers': {'Accept-Encoding': ACCEPT_ENCODING if compression else 'identity'},
+        # body is decompressed by client to count transferred bytes
+        'auto_decompress': False,
+    }  # type: Any
+
+    if pool:
+        kwargs['connector'] = TCPConnector(
+            limit=pool.get('limit', 100),
+            limit_per_host=pool.get('limit_per_host', 0),
+            keepalive_timeout=pool.get('keepalive_timeout', 15),
+            ttl_dns_cache=pool.get('dns_cache_ttl', 10),
+        )
+
+    return ClientSession(**kwargs)
 
 
 class RetryClientSession:
 
-    def __init__(self, options: dict) -> None:
+    def __init__(self, options: dict, session: ClientSession) -> None:
         self.total = options['total']
         self.factor = options.get('factor', 1)
         self.statuses = options.get('statuses', [])
@@ -27,7 +102,7 @@ class RetryClientSession:
             'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'
         ])
 
-        self.session = ClientSession(cookie_jar=CookieJar(unsafe=True))
+        self.session = session
 
     async def request(self, *args: Any, **kwargs: Any) -> ClientResponse:
         for total in range(self.total):
@@ -62,7 +137,12 @@ class AsyncJenkinsClient(Jenkins):
                  *,
                  verify: bool = True,
                  timeout: Optional[float] = None,
-                 retry: Optional[dict] = None
+                 retry: Optional[dict] = None,
+                 pool: Optional[dict] = None,
+                 compression: bool = True,
+                 json_loads: Optional[Callable] = None,
+                 cache: Optional[ResponseCache] = None,
+                 build_cache: Optional[BuildCache] = None
                  ) -> None:
         """
         Jenkins async client class.
@@ -105,42 +185,80 @@ class AsyncJenkinsClient(Jenkins):
                         statuses=[500]
                     )
 
+            pool (Optional[dict]):
+                HTTP connection pool options, aiohttp defaults are used if not
+                set.
+
+                - limit: ``int`` Total connections count (default 100).
+                - limit_per_host: ``int`` Connections count per host
+                    (default is no limit).
+                - keepalive_timeout: ``float`` Seconds to keep idle connection
+                    open for reuse (default 15).
+                - dns_cache_ttl: ``int`` Seconds to cache resolved DNS
+                    (default 10).
+
+                Example:
+
+                .. code-block:: python
+
+                    pool = dict(limit=50, keepalive_timeout=60)
+
+            compression (bool):
+                Ask server to compress responses with gzip, deflate or brotli
+                (if package is installed), body is decompressed incrementally
+                while reading. Transferred and decompressed bytes are counted
+                in ``traffic`` attribute (default: true).
+
+            json_loads (Optional[Callable]):
+                Function to decode JSON from bytes, by default fastest of
+                installed ``orjson``, ``msgspec``, ``ujson`` is used or
+                standard ``json`` module if none.
+
+            cache (Optional[ResponseCache]):
+                Cache of GET responses, see ``ujenkins.cache.ResponseCache``,
+                disabled by default.
+
+            build_cache (Optional[BuildCache]):
+                Permanent cache of completed builds, see
+                ``ujenkins.cache.BuildCache``, disabled by default.
+
         Returns:
             AsyncClient instance
         """
-        super().__init__()
+        super().__init__(json_loads, cache, build_cache)
 
         self.host = url.rstrip('/')
         self.crumb = None  # type: Any
+        self._crumb_lock = asyncio.Lock()
+        self._flights = {}  # type: dict[str, asyncio.Future]
+        self._pollers = {}  # type: dict[str, Tuple[dict, asyncio.Task]]
 
         self.auth = None
         if user and password:
             self.auth = BasicAuth(user, password)
 
-        # use unsafe cookie jar to be the same as requests package and add
-        # possibility to use password instead of tokens
-        # https://github.com/pbelskiy/ujenkins/issues/11
+        if pool:
+            self._validate_pool_argument(pool)
 
         if retry:
             self._validate_retry_argument(retry)
-            self.session = RetryClientSession(retry)
+
+        self._retry = retry or {}
+        session = _create_session(pool, compression)
+
+        if retry:
+            self.session = RetryClientSession(retry, session)
         else:
-            self.session = ClientSession(cookie_jar=CookieJar(unsafe=True))
+            self.session = session
+
+        self.traffic = {'compressed': 0, 'decompressed': 0}
 
         self.verify = verify
 
         if timeout:
             self.timeout = ClientTimeout(total=timeout)
 
-    async def _http_request(self,
-                            method: str,
-                            path: str,
-                            *,
-                            _raw_content: bool = False,
-                            _callback: Optional[Callable] = None,
-                            **kwargs: Any
-                            ) -> Any:
-
+    async def _send(self, method: str, path: str, **kwargs: Any) -> ClientResponse:
         if self.timeout and 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
 
@@ -153,7 +271,7 @@ class AsyncJenkinsClient(Jenkins):
         else:
             url = self.host + path
 
-        response = await self.session.request(
+        return await self.session.request(
             method,
             url,
             auth=self.auth,
@@ -161,20 +279,272 @@ class AsyncJenkinsClient(Jenkins):
             **kwargs
         )
 
-        if _raw_content:
-            text = '<binary>'
-            content = await response.read()
-        else:
-            text = await response.text()
-            content = None
+    async def _fetch(self,
+                     method: str,
+                     path: str,
+                     *,
+                     _fresh: bool = False,
+                     **kwargs: Any
+                     ) -> Response:
+        key, cached, validators = self._get_cached(method, path, kwargs.get('params'), _fresh)
+        if cached is not None:
+            return cached
+
+        request_kwargs = kwargs
+        if validators:
+            request_kwargs = {**kwargs, 'headers': {**(kwargs.get('headers') or {}), **validators}}
 
-        result = self._process(
-            Response(response.status, response.headers, text, content),
-            _callback
+        try:
+            response = await self._send(method, path, **request_kwargs)
+            content = await self._read(response)
+        except (ClientError, asyncio.TimeoutError) as e:
+            raise JenkinsError(f'Connection error: {e!r}') from e
+        finally:
+            self._invalidate_cached(method, path)
+
+        result = self._set_cached(
+            key,
+            Response(response.status, response.headers, content, response.charset),
         )
 
+        # cached response was evicted before it's confirmed by 304
+        if result is None:
+            return await self._fetch(method, path, _fresh=_fresh, **kwargs)
+
         return result
 
+    async def _http_request(self,
+                            method: str,
+                            path: str,
+                            *,
+                            _callback: Optional[Callable] = None,
+                            _fresh: bool = False,
+                            **kwargs: Any
+                            ) -> Any:
+
+        key = self._get_flight_key(method, path, kwargs, _fresh)
+        if key is None:
+            response = await self._fetch(method, path, _fresh=_fresh, **kwargs)
+            return self._process(response, _callback)
+
+        # concurrent identical requests wait for response of first one
+        future = self._flights.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(method, path, _fresh=_fresh, **kwargs))
+            self._flights[key] = future
+            future.add_done_callback(lambda _: self._flights.pop(key, None))
+
+        # cancellation of one caller must not cancel request of others
+        response = await asyncio.shield(future)
+        return self._process(response, _callback)
+
+    async def _stream(self,
+                      method: str,
+                      path: str,
+                      *,
+                      chunk_size: int = CHUNK_SIZE,
+                      _transform: Optional[StreamTransform] = None,
+                      **kwargs: Any
+                      ) -> AsyncIterator[Any]:
+        """
+        Stream response body by chunks without reading it into memory,
+        optional transform object converts chunks, see StreamTransform.
+        """
+        transform = _transform or StreamTransform()
+
+        # body could be read for long time, so timeout is applied to each read
+        # like in sync client, instead of whole request
+        if self.timeout and 'timeout' not in kwargs:
+            kwargs['timeout'] = ClientTimeout(
+                total=None,
+                sock_connect=self.timeout.total,
+                sock_read=self.timeout.total,
+            )
+
+        try:
+            response = await self._send(method, path, **kwargs)
+        except (ClientError, asyncio.TimeoutError) as e:
+            raise JenkinsError(f'Connection error: {e!r}') from e
+
+        try:
+            if response.status >= HTTPStatus.BAD_REQUEST:
+                self._process(Response(
+                    response.status,
+                    response.headers,
+                    await self._read(response),
+                    response.charset,
+                ))
+
+            transform.begin(response.headers)
+
+            try:
+                async for chunk in self._iter_content(response, chunk_size):
+                    for item in transform.feed(chunk):
+                        yield item
+            except (ClientError, asyncio.TimeoutError) as e:
+                raise JenkinsError(f'Connection error while reading response: {e!r}') from e
+
+            for item in transform.flush():
+                yield item
+        finally:
+            transform.close()
+            response.release()
+
+    async def _iterate(self,
+                       fetch: Callable,
+                       process: Callable,
+                       state: Any,
+                       prefetch: bool = False
+                       ) -> AsyncIterator[Any]:
+        """
+        Helper for polling and pagination loops.
+
+        Loop calls fetch(state) to make request and process(result, state)
+        which returns (items, next_state, delay), items are yielded, loop
+        stops when next state is None. With prefetch next request is made in
+        background while items are consumed, if there is no delay.
+        """
+        future = None  # type: Optional[asyncio.Future]
+
+        try:
+            while state is not None:
+                result = await (future if future else fetch(state))
+                items, state, delay = process(result, state)
+
+                future = None
+                if prefetch and state is not None and not delay:
+                    future = asyncio.ensure_future(fetch(state))
+
+                for item in items:
+                    yield item
+
+                if state is not None and delay:
+                    await asyncio.sleep(delay)
+        finally:
+            # iteration could be stopped by consumer before next page used
+            if future is not None:
+                future.cancel()
+
+    @staticmethod
+    async def _last(iterator: AsyncIterator[Any]) -> Any:
+        """
+        Exhaust iterator and return its last item.
+        """
+        last = None
+
+        async for item in iterator:
+            last = item
+
+        return last
+
+    async def _poll(self,
+                    key: str,
+                    item: Any,
+                    *,
+                    fetch: Callable,
+                    check: Callable,
+                    get_delay: Callable,
+                    timeout: Optional[float] = None
+                    ) -> Any:
+        """
+        Helper for waiting of item state change by polling.
+
+        Loop calls fetch(items) to make request and check(result, item)
+        which returns (done, value), value is returned when item is done or
+        raised if it's exception, get_delay(result, items) returns delay
+        before next request. All waiters with the same key share one poller
+        task, which requests state of all waited items at once, functions
+        of the first waiter are used. Transient errors of fetch are retried
+        up to POLL_RETRIES times, other errors are raised for all waiters.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        if key not in self._pollers:
+            waiters = {}  # type: dict[Any, List[asyncio.Future]]
+            task = asyncio.ensure_future(self._run_poller(key, fetch, check, get_delay))
+            self._pollers[key] = (waiters, task)
+
+        waiters = self._pollers[key][0]
+        waiters.setdefault(item, []).append(future)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as e:
+            raise JenkinsError(f'Timeout of waiting for {item} ({key})') from e
+        finally:
+            futures = waiters.get(item, [])
+            if future in futures:
+                futures.remove(future)
+                if not futures:
+                    del waiters[item]
+
+    async def _run_poller(self,
+                          key: str,
+                          fetch: Callable,
+                          check: Callable,
+                          get_delay: Callable
+                          ) -> None:
+        waiters = self._pollers[key][0]
+        delay = 1  # type: float
+        failures = 0
+
+        try:
+            while waiters:
+                items = list(waiters)
+
+                try:
+                    result = await fetch(items)
+                    resolved = [(item, *check(result, item)) for item in items]
+                    delay = get_delay(result, items)
+                    failures = 0
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    failures += 1
+                    if self._is_transient_error(e) and failures <= POLL_RETRIES:
+                        resolved = []
+                    else:
+                        resolved = [(item, True, e) for item in items]
+
+                for item, done, value in resolved:
+                    if done:
+                        self._set_poll_result(waiters.pop(item, []), value)
+
+                if waiters:
+                    await asyncio.sleep(delay)
+        finally:
+            del self._pollers[key]
+
+    @staticmethod
+    def _set_poll_result(futures: List[asyncio.Future], value: Any) -> None:
+        for future in futures:
+            if future.done():
+                continue
+
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+
+    async def _iter_content(self,
+                            response: ClientResponse,
+                            chunk_size: int = CHUNK_SIZE
+                            ) -> AsyncIterator[bytes]:
+        decompressor = Decompressor(response.headers.get('Content-Encoding', ''))
+
+        async for chunk in response.content.iter_chunked(chunk_size):
+            self.traffic['compressed'] += len(chunk)
+            data = decompressor.decompress(chunk)
+            self.traffic['decompressed'] += len(data)
+            if data:
+                yield data
+
+        data = decompressor.flush()
+        self.traffic['decompressed'] += len(data)
+        if data:
+            yield data
+
+    async def _read(self, response: ClientResponse) -> bytes:
+        return b''.join([chunk async for chunk in self._iter_content(response)])
+
     async def _get_crumb(self) -> Union[bool, dict]:
         try:
             response = await self._http_request('GET', CRUMB_ISSUER_URL)
@@ -191,18 +561,141 @@ class AsyncJenkinsClient(Jenkins):
         """
         Core class method for endpoints, which wraps auto crumb detection.
         """
-        if self.crumb:
+        crumb = self.crumb
+
+        if crumb:
             try:
                 return await self._http_request(method, path, **kwargs)
             except JenkinsError as e:
                 if e.status != HTTPStatus.FORBIDDEN:
                     raise
 
-        if self.crumb is not False:
-            self.crumb = await self._get_crumb()
+        if crumb is not False:
+            # concurrent requests must not fetch new crumb more than once
+            async with self._crumb_lock:
+                if self.crumb is crumb:
+                    self.crumb = await self._get_crumb()
 
         return await self._http_request(method, path, **kwargs)
 
+    async def _map_iter(self,
+                        func: Callable,
+                        iterable: Iterable,
+                        concurrency: int
+                        ) -> AsyncIterator[Tuple[int, Any, Any]]:
+        """
+        Run ``func`` for each item keeping not more than ``concurrency`` calls
+        in flight, yields (index, item, result) in order of completion.
+        """
+        if concurrency <= 0:
+            raise JenkinsError('Invalid `concurrency` argument must be > 0')
+
+        async def call(index: int, item: Any) -> Tuple[int, Any, Any]:
+            try:
+                return index, item, await func(item)
+            except JenkinsError as e:
+                return index, item, e
+
+        items = enumerate(iterable)
+        pending = set()  # type: set
+
+        try:
+            while True:
+                for index, item in items:
+                    pending.add(asyncio.ensure_future(call(index, item)))
+                    if len(pending) >= concurrency:
+                        break
+
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def map(self,
+                  func: Callable,
+                  iterable: Iterable,
+                  *,
+                  concurrency: int = 10
+                  ) -> List[Any]:
+        """
+        Call ``func`` for every item of iterable concurrently, but not more
+        than ``concurrency`` calls at the same time.
+
+        Errors don`t abort whole batch, instance of ``JenkinsError`` is
+        returned in place of result for failed item.
+
+        Example:
+
+        .. code-block:: python
+
+            infos = await client.map(
+                lambda x: client.builds.get_info(*x),
+                [('job', 1), ('job', 2), ('folder/job', 'lastBuild')],
+                concurrency=20,
+            )
+
+        Args:
+            func (Callable):
+                Coroutine function which accepts one item, e.g. endpoint method.
+
+            iterable (Iterable):
+                Items to process.
+
+            concurrency (int):
+                Maximum number of simultaneous calls (default: 10).
+
+        Returns:
+            List[Any]: results in the same order as items.
+        """
+        results = {}
+
+        async for index, _, result in self._map_iter(func, iterable, concurrency):
+            results[index] = result
+
+        return [results[index] for index in range(len(results))]
+
+    async def as_completed(self,
+                           func: Callable,
+                           iterable: Iterable,
+                           *,
+                           concurrency: int = 10
+                           ) -> AsyncIterator[Tuple[Any, Any]]:
+        """
+        Same as ``map()``, but yields results as soon as they are ready.
+
+        Example:
+
+        .. code-block:: python
+
+            async for item, result in client.as_completed(func, items):
+                if isinstance(result, JenkinsError):
+                    print(item, 'failed')
+
+        Args:
+            func (Callable):
+                Coroutine function which accepts one item, e.g. endpoint method.
+
+            iterable (Iterable):
+                Items to process.
+
+            concurrency (int):
+                Maximum number of simultaneous calls (default: 10).
+
+        Returns:
+            AsyncIterator[Tuple[Any, Any]]: item and its result (or error).
+        """
+        async for _, item, result in self._map_iter(func, iterable, concurrency):
+            yield item, result
+
     @staticmethod
     async def _chain(functions: List[Callable]) -> Any:
         """
@@ -1,13 +1,21 @@
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from http import HTTPStatus
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
-from requests import Session
-from requests.adapters import HTTPAdapter
+from requests import RequestException, Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib3.util.retry import Retry
 
-from ujenkins.adapters import CRUMB_ISSUER_URL
+from ujenkins.adapters import ACCEPT_ENCODING, CRUMB_ISSUER_URL, POLL_RETRIES
+from ujenkins.cache import BuildCache, ResponseCache
 from ujenkins.core import Jenkins, Response
 from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from ujenkins.helpers import StreamTransform
+
+CHUNK_SIZE = 64 * 1024
 
 
 class JenkinsClient(Jenkins):
@@ -19,7 +27,12 @@ class JenkinsClient(Jenkins):
                  *,
                  verify: bool = True,
                  timeout: Optional[float] = None,
-                 retry: Optional[dict] = None
+                 retry: Optional[dict] = None,
+                 pool: Optional[dict] = None,
+                 compression: bool = True,
+                 json_loads: Optional[Callable] = None,
+                 cache: Optional[ResponseCache] = None,
+                 build_cache: Optional[BuildCache] = None
                  ) -> None:
         """
         Jenkins sync client class.
@@ -89,10 +102,48 @@ class JenkinsClient(Jenkins):
                 20            72.8 hours
                 ============  =============
 
+            pool (Optional[dict]):
+                HTTP connection pool options, by default pool of 10 connections
+                is used and enlarged automatically by ``map()``. If set, pool
+                size is fixed and requests wait for free connection.
+
+                - limit: ``int`` Total connections count.
+                - limit_per_host: ``int`` Connections count per host, has
+                    priority over limit.
+                - keepalive_timeout: ``float`` Ignored, supported by async
+                    client only.
+                - dns_cache_ttl: ``int`` Ignored, supported by async client
+                    only.
+
+                Example:
+
+                .. code-block:: python
+
+                    pool = dict(limit=50)
+
+            compression (bool):
+                Ask server to compress responses with gzip, deflate or brotli
+                (if package is installed), body is decompressed incrementally
+                by urllib3. Transferred and decompressed bytes are counted in
+                ``traffic`` attribute (default: true).
+
+            json_loads (Optional[Callable]):
+                Function to decode JSON from bytes, by default fastest of
+                installed ``orjson``, ``msgspec``, ``ujson`` is used or
+                standard ``json`` module if none.
+
+            cache (Optional[ResponseCache]):
+                Cache of GET responses, see ``ujenkins.cache.ResponseCache``,
+                disabled by default.
+
+            build_cache (Optional[BuildCache]):
+                Permanent cache of completed builds, see
+                ``ujenkins.cache.BuildCache``, disabled by default.
+
         Returns:
             Client instance
         """
-        super().__init__()
+        super().__init__(json_loads, cache, build_cache)
 
         self.host = url.rstrip('/')
         self.session = Session()
@@ -100,35 +151,64 @@ class JenkinsClient(Jenkins):
         if user and password:
             self.session.auth = (user, password)
 
+        self.session.headers['Accept-Encoding'] = (
+            ACCEPT_ENCODING if compression else 'identity'
+        )
+
+        self.traffic = {'compressed': 0, 'decompressed': 0}
+        self._traffic_lock = threading.Lock()
+
         self.timeout = timeout
         self.verify = verify
         self.crumb = None  # type: Any
-
-        if not retry:
-            return
-
-        self._validate_retry_argument(retry)
-        adapter = HTTPAdapter(max_retries=Retry(
-            total=retry['total'],
-            backoff_factor=retry.get('factor', 1),
-            status_forcelist=retry.get('statuses', []),
-            allowed_methods=retry.get('methods', [
-                'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'
-            ]),
-        ))
+        self._crumb_lock = threading.Lock()
+
+        self._flights = {}  # type: dict[str, Future]
+        self._flights_lock = threading.Lock()
+
+        self._max_retries = None  # type: Optional[Retry]
+        self._pool_maxsize = DEFAULT_POOLSIZE
+        self._pool_block = False
+
+        self._retry = retry or {}
+
+        if retry:
+            self._validate_retry_argument(retry)
+            self._max_retries = Retry(
+                total=retry['total'],
+                backoff_factor=retry.get('factor', 1),
+                status_forcelist=retry.get('statuses', []),
+                allowed_methods=retry.get('methods', [
+                    'DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT', 'TRACE'
+                ]),
+            )
+
+        if pool:
+            self._validate_pool_argument(pool)
+            self._pool_maxsize = pool.get('limit_per_host', pool.get('limit', DEFAULT_POOLSIZE))
+            self._pool_block = True
+
+        if retry or pool:
+            self._mount_adapter(self._pool_maxsize)
+
+    def _mount_adapter(self, pool_maxsize: int) -> None:
+        if self._max_retries is None:
+            adapter = HTTPAdapter(
+                pool_maxsize=pool_maxsize,
+                pool_block=self._pool_block
+            )
+        else:
+            adapter = HTTPAdapter(
+                pool_maxsize=pool_maxsize,
+                pool_block=self._pool_block,
+                max_retries=self._max_retries
+            )
 
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
+        self._pool_maxsize = pool_maxsize
 
-    def _http_request(self,
-                      method: str,
-                      path: str,
-                      *,
-                      _raw_content: bool = False,
-                      _callback: Optional[Callable] = None,
-                      **kwargs: Any
-                      ) -> Any:
-
+    def _send(self, method: str, path: str, **kwargs: Any) -> Any:
         if self.timeout and 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
 
@@ -141,27 +221,233 @@ class JenkinsClient(Jenkins):
         else:
             url = self.host + path
 
-        response = self.session.request(
+        return self.session.request(
             method,
             url,
             verify=self.verify,
             **kwargs
         )
 
-        if _raw_content:
-            text = '<binary>'
+    def _fetch(self,
+               method: str,
+               path: str,
+               *,
+               _fresh: bool = False,
+               **kwargs: Any
+               ) -> Response:
+        key, cached, validators = self._get_cached(method, path, kwargs.get('params'), _fresh)
+        if cached is not None:
+            return cached
+
+        request_kwargs = kwargs
+        if validators:
+            request_kwargs = {**kwargs, 'headers': {**(kwargs.get('headers') or {}), **validators}}
+
+        try:
+            response = self._send(method, path, **request_kwargs)
             content = response.content
-        else:
-            text = response.text
-            content = None
+        except RequestException as e:
+            raise JenkinsError(f'Connection error: {e!r}') from e
+        finally:
+            self._invalidate_cached(method, path)
 
-        result = self._process(
-            Response(response.status_code, response.headers, text, content),
-            _callback
+        self._count_traffic(self._get_wire_size(response), len(content))
+
+        result = self._set_cached(
+            key,
+            Response(response.status_code, response.headers, content, response.encoding),
         )
 
+        # cached response was evicted before it's confirmed by 304
+        if result is None:
+            return self._fetch(method, path, _fresh=_fresh, **kwargs)
+
         return result
 
+    def _http_request(self,
+                      method: str,
+                      path: str,
+                      *,
+                      _callback: Optional[Callable] = None,
+                      _fresh: bool = False,
+                      **kwargs: Any
+                      ) -> Any:
+
+        key = self._get_flight_key(method, path, kwargs, _fresh)
+        if key is None:
+            return self._process(self._fetch(method, path, _fresh=_fresh, **kwargs), _callback)
+
+        # concurrent identical requests wait for response of first one
+        with self._flights_lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if future is None:
+                future = self._flights[key] = Future()
+
+        if leader:
+            try:
+                future.set_result(self._fetch(method, path, _fresh=_fresh, **kwargs))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+            finally:
+                with self._flights_lock:
+                    del self._flights[key]
+
+        return self._process(future.result(), _callback)
+
+    def _stream(self,
+                method: str,
+                path: str,
+                *,
+                chunk_size: int = CHUNK_SIZE,
+                _transform: Optional[StreamTransform] = None,
+                **kwargs: Any
+                ) -> Iterator[Any]:
+        """
+        Stream response body by chunks without reading it into memory,
+        optional transform object converts chunks, see StreamTransform.
+        """
+        transform = _transform or StreamTransform()
+
+        try:
+            response = self._send(method, path, stream=True, **kwargs)
+        except RequestException as e:
+            raise JenkinsError(f'Connection error: {e!r}') from e
+
+        with response:
+            try:
+                if response.status_code >= HTTPStatus.BAD_REQUEST:
+                    self._process(Response(
+                        response.status_code,
+                        response.headers,
+                        response.content,
+                        response.encoding,
+                    ))
+
+                transform.begin(response.headers)
+                decompressed = 0
+
+                try:
+                    for chunk in response.iter_content(chunk_size):
+                        decompressed += len(chunk)
+                        yield from transform.feed(chunk)
+                except RequestException as e:
+                    raise JenkinsError(
+                        f'Connection error while reading response: {e!r}'
+                    ) from e
+
+                yield from transform.flush()
+
+                self._count_traffic(self._get_wire_size(response), decompressed)
+            finally:
+                transform.close()
+
+    def _iterate(self,
+                 fetch: Callable,
+                 process: Callable,
+                 state: Any,
+                 prefetch: bool = False
+                 ) -> Iterator[Any]:
+        """
+        Helper for polling and pagination loops.
+
+        Loop calls fetch(state) to make request and process(result, state)
+        which returns (items, next_state, delay), items are yielded, loop
+        stops when next state is None. With prefetch next request is made in
+        background while items are consumed, if there is no delay.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = None  # type: Optional[Future]
+
+            while state is not None:
+                result = future.result() if future else fetch(state)
+                items, state, delay = process(result, state)
+
+                future = None
+                if prefetch and state is not None and not delay:
+                    future = executor.submit(fetch, state)
+
+                yield from items
+
+                if state is not None and delay:
+                    time.sleep(delay)
+
+    @staticmethod
+    def _last(iterator: Iterator[Any]) -> Any:
+        """
+        Exhaust iterator and return its last item.
+        """
+        last = None
+
+        for item in iterator:
+            last = item
+
+        return last
+
+    def _poll(self,
+              key: str,
+              item: Any,
+              *,
+              fetch: Callable,
+              check: Callable,
+              get_delay: Callable,
+              timeout: Optional[float] = None
+              ) -> Any:
+        """
+        Helper for waiting of item state change by polling.
+
+        Loop calls fetch(items) to make request and check(result, item)
+        which returns (done, value), value is returned when item is done or
+        raised if it's exception, get_delay(result, items) returns delay
+        before next request. Async client shares requests of all waiters
+        with the same key, sync client polls for each caller separately.
+        Transient errors of fetch are retried up to POLL_RETRIES times.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 1  # type: float
+        failures = 0
+
+        while True:
+            try:
+                result = fetch([item])
+            except JenkinsError as e:
+                failures += 1
+                if not self._is_transient_error(e) or failures > POLL_RETRIES:
+                    raise
+            else:
+                failures = 0
+                done, value = check(result, item)
+
+                if done:
+                    if isinstance(value, Exception):
+                        raise value
+                    return value
+
+                delay = get_delay(result, [item])
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise JenkinsError(f'Timeout of waiting for {item} ({key})')
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+
+    @staticmethod
+    def _get_wire_size(response: Any) -> Optional[int]:
+        try:
+            return response.raw.tell()
+        except AttributeError:
+            return None
+
+    def _count_traffic(self, compressed: Optional[int], decompressed: int) -> None:
+        if compressed is None:
+            compressed = decompressed
+
+        with self._traffic_lock:
+            self.traffic['compressed'] += compressed
+            self.traffic['decompressed'] += decompressed
+
     def _get_crumb(self) -> Union[bool, dict]:
         try:
             response = self._http_request('GET', CRUMB_ISSUER_URL)
@@ -178,18 +464,147 @@ class JenkinsClient(Jenkins):
         """
         Core class method for endpoints, which wraps auto crumb detection.
         """
-        if self.crumb:
+        crumb = self.crumb
+
+        if crumb:
             try:
                 return self._http_request(method, path, **kwargs)
             except JenkinsError as e:
                 if e.status != HTTPStatus.FORBIDDEN:
                     raise
 
-        if self.crumb is not False:
-            self.crumb = self._get_crumb()
+        if crumb is not False:
+            # concurrent threads must not fetch new crumb more than once
+            with self._crumb_lock:
+                if self.crumb is crumb:
+                    self.crumb = self._get_crumb()
 
         return self._http_request(method, path, **kwargs)
 
+    def _map_iter(self,
+                  func: Callable,
+                  iterable: Iterable,
+                  concurrency: int
+                  ) -> Iterator[Tuple[int, Any, Any]]:
+        """
+        Run ``func`` for each item in thread pool keeping not more than
+        ``concurrency`` calls in flight, yields (index, item, result) in order
+        of completion.
+        """
+        if concurrency <= 0:
+            raise JenkinsError('Invalid `concurrency` argument must be > 0')
+
+        # each worker needs its own connection, otherwise urllib3 discards
+        # connections which don't fit in pool and reconnects every time
+        if not self._pool_block and concurrency > self._pool_maxsize:
+            self._mount_adapter(concurrency)
+
+        def call(index: int, item: Any) -> Tuple[int, Any, Any]:
+            try:
+                return index, item, func(item)
+            except JenkinsError as e:
+                return index, item, e
+
+        items = enumerate(iterable)
+        pending = set()  # type: set
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            try:
+                while True:
+                    for index, item in items:
+                        pending.add(executor.submit(call, index, item))
+                        if len(pending) >= concurrency:
+                            break
+
+                    if not pending:
+                        break
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def map(self,
+            func: Callable,
+            iterable: Iterable,
+            *,
+            concurrency: int = 10
+            ) -> List[Any]:
+        """
+        Call ``func`` for every item of iterable in thread pool, but not more
+        than ``concurrency`` calls at the same time. HTTP connection pool is
+        enlarged to ``concurrency`` if needed, session and crumb are shared
+        between all workers.
+
+        Errors don`t abort whole batch, instance of ``JenkinsError`` is
+        returned in place of result for failed item.
+
+        Example:
+
+        .. code-block:: python
+
+            infos = client.map(
+                lambda x: client.builds.get_info(*x),
+                [('job', 1), ('job', 2), ('folder/job', 'lastBuild')],
+                concurrency=20,
+            )
+
+        Args:
+            func (Callable):
+                Function which accepts one item, e.g. endpoint method.
+
+            iterable (Iterable):
+                Items to process.
+
+            concurrency (int):
+                Maximum number of worker threads (default: 10).
+
+        Returns:
+            List[Any]: results in the same order as items.
+        """
+        results = {}
+
+        for index, _, result in self._map_iter(func, iterable, concurrency):
+            results[index] = result
+
+        return [results[index] for index in range(len(results))]
+
+    def as_completed(self,
+                     func: Callable,
+                     iterable: Iterable,
+                     *,
+                     concurrency: int = 10
+                     ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Same as ``map()``, but yields results as soon as they are ready.
+
+        Example:
+
+        .. code-block:: python
+
+            for item, result in client.as_completed(func, items):
+                if isinstance(result, JenkinsError):
+                    print(item, 'failed')
+
+        Args:
+            func (Callable):
+                Function which accepts one item, e.g. endpoint method.
+
+            iterable (Iterable):
+                Items to process.
+
+            concurrency (int):
+                Maximum number of worker threads (default: 10).
+
+        Returns:
+            Iterator[Tuple[Any, Any]]: item and its result (or error).
+        """
+        for _, item, result in self._map_iter(func, iterable, concurrency):
+            yield item, result
+
     @staticmethod
     def _chain(functions: List[Callable]) -> Any:
         """
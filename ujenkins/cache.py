@@ -0,0 +1,567 @@
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+from multidict import CIMultiDictProxy
+from requests.structures import CaseInsensitiveDict
+
+from ujenkins.exceptions import JenkinsError
+
+
+class Response(NamedTuple):
+    status: int
+    headers: Union[CaseInsensitiveDict, CIMultiDictProxy]
+    content: bytes
+    encoding: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        # decoded on demand only, JSON is parsed from bytes directly
+        return self.content.decode(self.encoding or 'utf-8', 'replace')
+
+
+class CacheEntry(NamedTuple):
+    response: Any
+    expires: float
+    size: int
+
+
+class MemoryStorage:
+    """
+    In-memory LRU storage limited by entries count and total size.
+
+    Args:
+        max_entries (int):
+            Maximum number of stored entries (default: 1000).
+
+        max_bytes (Optional[int]):
+            Maximum total size of stored responses in bytes, not limited by
+            default.
+    """
+    def __init__(self, max_entries: int = 1000, max_bytes: Optional[int] = None) -> None:
+        if max_entries <= 0:
+            raise JenkinsError('Invalid `max_entries` argument must be > 0')
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        self._entries = OrderedDict()  # type: OrderedDict[str, CacheEntry]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+
+            self._entries[key] = entry
+            self.size += entry.size
+
+            while (
+                len(self._entries) > self.max_entries or
+                (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                _, old = self._entries.popitem(last=False)
+                self.size -= old.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def keys(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SQLiteStorage:
+    """
+    Storage in SQLite database file limited by entries count and total size,
+    least recently used entries are evicted. Database can be shared by
+    several processes, e.g. short-lived CLI tools reuse responses of each
+    other. Use separate file for each Jenkins server. Crumb is bound to
+    session, so it's never stored and each process requests its own.
+
+    Example:
+
+    .. code-block:: python
+
+        cache = ResponseCache(ttl=300, storage=SQLiteStorage('~/.cache/jenkins.db'))
+
+    Args:
+        path (Union[str, os.PathLike]):
+            Database file path, created if not exists.
+
+        max_entries (int):
+            Maximum number of stored entries (default: 10000).
+
+        max_bytes (Optional[int]):
+            Maximum total size of stored responses in bytes, not limited by
+            default.
+
+        timeout (float):
+            Seconds to wait for database lock held by other process
+            (default: 10).
+    """
+    def __init__(self,
+                 path: Union[str, os.PathLike],
+                 *,
+                 max_entries: int = 10000,
+                 max_bytes: Optional[int] = None,
+                 timeout: float = 10
+                 ) -> None:
+        if max_entries <= 0:
+            raise JenkinsError('Invalid `max_entries` argument must be > 0')
+
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False)
+
+        with self._lock, self._db:
+            # WAL allows readers to work simultaneously with writer
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, status INTEGER, headers TEXT, content BLOB, '
+                'encoding TEXT, expires REAL, size INTEGER, accessed REAL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)'
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT TOTAL(size) FROM entries').fetchone()[0]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                'SELECT status, headers, content, encoding, expires, size '
+                'FROM entries WHERE key = ?',
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            self._db.execute(
+                'UPDATE entries SET accessed = ? WHERE key = ?',
+                (time.time(), key),
+            )
+
+        status, headers, content, encoding, expires, size = row
+        response = Response(status, CaseInsensitiveDict(json.loads(headers)), content, encoding)
+
+        return CacheEntry(response, expires, size)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+
+        response = entry.response
+        headers = json.dumps(list(response.headers.items()))
+
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    response.status,
+                    headers,
+                    response.content,
+                    response.encoding,
+                    entry.expires,
+                    entry.size,
+                    time.time(),
+                ),
+            )
+
+            self._db.execute(
+                'DELETE FROM entries WHERE key IN ('
+                'SELECT key FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,),
+            )
+
+            if self.max_bytes is not None:
+                self._db.execute(
+                    'DELETE FROM entries WHERE key IN ('
+                    'SELECT key FROM (SELECT key, SUM(size) OVER '
+                    '(ORDER BY accessed DESC, key) AS total FROM entries) '
+                    'WHERE total > ?)',
+                    (self.max_bytes,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+
+    def keys(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._db.execute('SELECT key FROM entries').fetchall()
+            return iter([row[0] for row in rows])
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM entries')
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Cache of GET responses, consulted by client before HTTP request. Any
+    other request (POST etc.) invalidates cached responses of affected
+    resource and API listings of its parents, e.g. ``POST /job/a/doDelete``
+    drops ``/job/a/...``, ``/api/json`` and so on.
+
+    Responses are stored as is and processed on each hit, so returned
+    objects are never shared between callers.
+
+    Expired response which has ``ETag`` or ``Last-Modified`` validators is
+    revalidated by conditional request, and reused if server answers
+    ``304 Not Modified``. Counters are available in ``stats`` attribute:
+    ``hits`` - fresh responses, ``misses`` - requests sent to server,
+    ``revalidated`` - misses answered by 304.
+
+    Example:
+
+    .. code-block:: python
+
+        cache = ResponseCache(
+            ttl=5,
+            rules={r'^/computer/': 30, r'/consoleText$': 0},
+            max_bytes=100 * 1024 * 1024,
+        )
+        client = JenkinsClient('http://server', cache=cache)
+
+    Args:
+        ttl (float):
+            Default time to live of response in seconds (default: 10).
+
+        rules (Optional[Dict[str, float]]):
+            Time to live for requests which path matches regular expression,
+            first matched rule is used, zero means do not cache, except
+            responses with validators when revalidation is enabled.
+
+        max_entries (int):
+            Maximum number of cached responses (default: 1000).
+
+        max_bytes (Optional[int]):
+            Maximum total size of cached responses, not limited by default.
+
+        storage (Optional[Any]):
+            Storage object, by default ``MemoryStorage`` with LRU eviction,
+            ``SQLiteStorage`` could be used to persist responses on disk.
+
+        revalidate (bool):
+            Revalidate expired responses using conditional requests, then
+            responses with validators are stored even with zero time to
+            live and revalidated on each request (default: true).
+    """
+    def __init__(self,
+                 ttl: float = 10,
+                 *,
+                 rules: Optional[Dict[str, float]] = None,
+                 max_entries: int = 1000,
+                 max_bytes: Optional[int] = None,
+                 storage: Optional[Any] = None,
+                 revalidate: bool = True
+                 ) -> None:
+        self.ttl = ttl
+        self.rules = [(re.compile(k), v) for k, v in (rules or {}).items()]
+        self.storage = storage if storage is not None else MemoryStorage(max_entries, max_bytes)
+        self.revalidate = revalidate
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0}
+
+    @staticmethod
+    def make_key(path: str, params: Any = None) -> str:
+        if not params:
+            return path
+
+        if isinstance(params, dict):
+            params = sorted(params.items())
+
+        separator = '&' if '?' in path else '?'
+        return path + separator + urlencode(list(params))
+
+    @staticmethod
+    def get_validators(response: Any) -> Dict[str, str]:
+        """
+        Make conditional request headers from response validators.
+        """
+        headers = {}
+
+        if response.headers.get('ETag'):
+            headers['If-None-Match'] = response.headers['ETag']
+
+        if response.headers.get('Last-Modified'):
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+
+        return headers
+
+    def get_ttl(self, key: str) -> float:
+        path = key.split('?', 1)[0]
+
+        for regexp, ttl in self.rules:
+            if regexp.search(path):
+                return ttl
+
+        return self.ttl
+
+    def get(self, key: str) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Get fresh response, or validators of expired one for conditional
+        request.
+        """
+        entry = self.storage.get(key)
+
+        if entry is not None and entry.expires > time.time():
+            self.stats['hits'] += 1
+            return entry.response, {}
+
+        self.stats['misses'] += 1
+
+        if entry is None or not self.revalidate:
+            return None, {}
+
+        return None, self.get_validators(entry.response)
+
+    def set(self, key: str, response: Any) -> None:
+        ttl = self.get_ttl(key)
+        if ttl <= 0 and not (self.revalidate and self.get_validators(response)):
+            return
+
+        size = len(response.content)
+        self.storage.set(key, CacheEntry(response, time.time() + max(ttl, 0), size))
+
+    def refresh(self, key: str) -> Optional[Any]:
+        """
+        Prolong expired response after server confirmed it's not modified.
+        """
+        entry = self.storage.get(key)
+        if entry is None:
+            return None
+
+        self.stats['revalidated'] += 1
+
+        expires = time.time() + max(self.get_ttl(key), 0)
+        self.storage.set(key, entry._replace(expires=expires))
+
+        return entry.response
+
+    def invalidate(self, prefix: str = '') -> None:
+        """
+        Drop cached responses which path starts with prefix, everything by
+        default.
+
+        Args:
+            prefix (str):
+                Path prefix, e.g. ``/job/my_job/``.
+
+        Returns:
+            None
+        """
+        if not prefix:
+            self.storage.clear()
+            return
+
+        for key in self.storage.keys():
+            if key.startswith(prefix):
+                self.storage.delete(key)
+
+    def invalidate_related(self, path: str) -> None:
+        """
+        Drop cached responses affected by modification of resource.
+
+        Args:
+            path (str):
+                Path of modifying request, e.g. ``/job/my_job/doDelete``.
+
+        Returns:
+            None
+        """
+        base = path.split('?', 1)[0].rsplit('/', 1)[0] + '/'
+        self.invalidate(base)
+
+        parts = base.strip('/').split('/')
+        for i in range(len(parts)):
+            self.invalidate('/' + ''.join(p + '/' for p in parts[:i]) + 'api/json')
+
+
+class BuildCache:
+    """
+    Permanent cache of completed builds data (information, console output),
+    which never changes until build is deleted. Data is keyed by job URL
+    (including Jenkins host, so cache could be shared by clients of different
+    servers) and build number. Symbolic build ids like ``lastBuild`` are
+    resolved to number before caching, builds which are still running are
+    never cached.
+
+    Data is kept in memory, and optionally in directory on disk to be reused
+    between runs.
+
+    Example:
+
+    .. code-block:: python
+
+        client = JenkinsClient('http://server', build_cache=BuildCache('/tmp/builds'))
+
+    Args:
+        path (Optional[Union[str, os.PathLike]]):
+            Directory to store data on disk, memory only by default.
+
+        max_entries (int):
+            Maximum number of entries kept in memory (default: 1000).
+
+        max_bytes (Optional[int]):
+            Maximum total size of entries kept in memory, None means not
+            limited (default: 64 MiB).
+    """
+    def __init__(self,
+                 path: Optional[Union[str, os.PathLike]] = None,
+                 *,
+                 max_entries: int = 1000,
+                 max_bytes: Optional[int] = 64 * 1024 * 1024
+                 ) -> None:
+        self.path = path
+        self.memory = MemoryStorage(max_entries, max_bytes)
+        self.stats = {'hits': 0, 'misses': 0}
+
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    @staticmethod
+    def make_key(url: str, number: Optional[int] = None, kind: str = '') -> str:
+        key = url.rstrip('/') + '#'
+        if number is None:
+            return key
+
+        return f'{key}{number}#{kind}'
+
+    def _get_file(self, url: str, number: Optional[int] = None, kind: str = '') -> str:
+        job_hash = hashlib.sha1(url.rstrip('/').encode()).hexdigest()
+        job_dir = os.path.join(self.path, job_hash)  # type: ignore[arg-type]
+        if number is None:
+            return job_dir
+
+        return os.path.join(job_dir, f'{number}.{kind}.json')
+
+    def get(self, url: str, number: int, kind: str) -> Optional[Any]:
+        key = self.make_key(url, number, kind)
+        entry = self.memory.get(key)
+
+        if entry is None and self.path is not None:
+            try:
+                with open(self._get_file(url, number, kind), 'rb') as f:
+                    content = f.read()
+            except OSError:
+                pass
+            else:
+                entry = CacheEntry(content, math.inf, len(content))
+                self.memory.set(key, entry)
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['hits'] += 1
+        # decode each time, so returned objects are never shared
+        return json.loads(entry.response)
+
+    def set(self, url: str, number: int, kind: str, value: Any) -> None:
+        content = json.dumps(value).encode()
+        self.memory.set(
+            self.make_key(url, number, kind),
+            CacheEntry(content, math.inf, len(content)),
+        )
+
+        if self.path is None:
+            return
+
+        file_path = self._get_file(url, number, kind)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # write to temporary file first, so readers never see partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, file_path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+
+    def delete(self, url: str, number: Optional[int] = None) -> None:
+        """
+        Drop cached data of build, or all builds of job if number is not set.
+
+        Args:
+            url (str):
+                Job URL, e.g. ``http://server/job/folder/job/name``.
+
+            number (Optional[int]):
+                Build number.
+
+        Returns:
+            None
+        """
+        prefix = self.make_key(url, number)
+        for key in self.memory.keys():
+            if key.startswith(prefix):
+                self.memory.delete(key)
+
+        if self.path is None:
+            return
+
+        if number is None:
+            shutil.rmtree(self._get_file(url), ignore_errors=True)
+            return
+
+        job_dir = self._get_file(url)
+        if not os.path.isdir(job_dir):
+            return
+
+        for file_name in os.listdir(job_dir):
+            if file_name.startswith(f'{number}.'):
+                os.remove(os.path.join(job_dir, file_name))
@@ -1,11 +1,10 @@
 import json
 
 from http import HTTPStatus
-from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
-
-from multidict import CIMultiDictProxy
-from requests.structures import CaseInsensitiveDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
+from ujenkins.adapters import CRUMB_ISSUER_URL
+from ujenkins.cache import BuildCache, Response, ResponseCache
 from ujenkins.endpoints import (
     Builds,
     Jobs,
@@ -17,17 +16,32 @@ from ujenkins.endpoints import (
 )
 from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
 
-
-class Response(NamedTuple):
-    status: int
-    headers: Union[CaseInsensitiveDict, CIMultiDictProxy]
-    text: str
-    content: Optional[bytes] = None
+# fastest available JSON decoder which is able to parse bytes
+try:
+    from orjson import loads as JSON_LOADS  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        from msgspec.json import decode as JSON_LOADS  # type: ignore
+    except ImportError:
+        try:
+            from ujson import loads as JSON_LOADS  # type: ignore
+        except ImportError:
+            JSON_LOADS = json.loads
 
 
 class Jenkins:
 
-    def __init__(self) -> None:
+    host = ''
+
+    def __init__(self,
+                 json_loads: Optional[Callable] = None,
+                 cache: Optional[ResponseCache] = None,
+                 build_cache: Optional[BuildCache] = None
+                 ) -> None:
+        self._json_loads = json_loads or JSON_LOADS
+        self.cache = cache
+        self.build_cache = build_cache
+
         self.builds = Builds(self)
         self.jobs = Jobs(self)
         self.nodes = Nodes(self)
@@ -36,8 +50,7 @@ class Jenkins:
         self.system = System(self)
         self.views = Views(self)
 
-    @staticmethod
-    def _process(response: Response, callback: Optional[Callable] = None) -> Any:
+    def _process(self, response: Response, callback: Optional[Callable] = None) -> Any:
         if response.status == HTTPStatus.NOT_FOUND:
             raise JenkinsNotFoundError(response.text)
 
@@ -54,6 +67,7 @@ class Jenkins:
             raise JenkinsError(
                 f'Request error [{response.status}], {details}',
                 status=response.status,
+                headers=response.headers,
             )
 
         # TODO: add response type annotations, parse json for callback
@@ -61,10 +75,109 @@ class Jenkins:
             return callback(response)
 
         if 'application/json' in response.headers.get('Content-Type', ''):
-            return json.loads(response.text)
+            return self._parse_json(response)
 
         return None
 
+    def _parse_json(self, response: Response) -> Any:
+        """
+        Shared JSON decoding for all endpoints, raw bytes are parsed to skip
+        intermediate str.
+        """
+        return self._json_loads(response.content)
+
+    def _get_cached(self,
+                    method: str,
+                    path: str,
+                    params: Any = None,
+                    fresh: bool = False
+                    ) -> Tuple[Optional[str], Optional[Response], Dict[str, str]]:
+        """
+        Find cached response, returns cache key for GET request, cached
+        response if it's fresh or conditional request headers if expired,
+        mutating methods invalidate affected entries. Crumb is never cached.
+        With ``fresh`` cache is not looked up, but response is stored.
+        """
+        if self.cache is None:
+            return None, None, {}
+
+        if path.startswith(self.host):
+            path = path[len(self.host):]
+
+        # crumb is bound to session and must be requested again after 403
+        if path == CRUMB_ISSUER_URL:
+            return None, None, {}
+
+        if method.upper() != 'GET':
+            self._invalidate_cached(method, path)
+            return None, None, {}
+
+        key = self.cache.make_key(path, params)
+        if fresh:
+            return key, None, {}
+
+        return (key, *self.cache.get(key))
+
+    def _invalidate_cached(self, method: str, path: str) -> None:
+        """
+        Drop cached responses affected by mutating request, it's called before
+        request and after response, so GET made while request is in flight
+        can't keep old state in cache.
+        """
+        if self.cache is None or method.upper() not in ('POST', 'PUT', 'DELETE', 'PATCH'):
+            return
+
+        if path.startswith(self.host):
+            path = path[len(self.host):]
+
+        self.cache.invalidate_related(path)
+
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """
+        Error of poll which could be retried: connection error or server
+        failure, e.g. 503 Service Unavailable while Jenkins restarts.
+        """
+        if not isinstance(error, JenkinsError) or isinstance(error, JenkinsNotFoundError):
+            return False
+
+        return error.status is None or error.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+    @staticmethod
+    def _get_flight_key(method: str,
+                        path: str,
+                        kwargs: dict,
+                        fresh: bool = False
+                        ) -> Optional[str]:
+        """
+        Key of identical in-flight request, which response could be shared,
+        only GET requests without body and extra headers are coalesced,
+        requests bypassing cache are coalesced only with each other.
+        """
+        if method.upper() != 'GET' or not set(kwargs) <= {'params'}:
+            return None
+
+        key = ResponseCache.make_key(path, kwargs.get('params'))
+
+        return f'fresh:{key}' if fresh else key
+
+    def _set_cached(self, key: Optional[str], response: Response) -> Optional[Response]:
+        """
+        Store received response in cache, returns cached response instead of
+        304 Not Modified answer to conditional request, or None if it was
+        evicted meanwhile and request must be sent again.
+        """
+        if key is None or self.cache is None:
+            return response
+
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return self.cache.refresh(key)
+
+        if response.status == HTTPStatus.OK:
+            self.cache.set(key, response)
+
+        return response
+
     @staticmethod
     def _get_folder_and_job_name(name: str) -> Tuple[str, str]:
         parts = name.split('/')
@@ -86,6 +199,16 @@ class Jenkins:
         if retry.get('total', 0) <= 0:
             raise JenkinsError('Invalid `total` in retry argument must be > 0')
 
+    @staticmethod
+    def _validate_pool_argument(pool: dict) -> None:
+        for key in pool:
+            if key not in ('limit', 'limit_per_host', 'keepalive_timeout', 'dns_cache_ttl'):
+                raise JenkinsError('Unknown key in pool argument: ' + key)
+
+        for key in ('limit', 'limit_per_host'):
+            if key in pool and pool[key] <= 0:
+                raise JenkinsError(f'Invalid `{key}` in pool argument must be > 0')
+
     @staticmethod
     def _return_text(response: Response) -> str:
         return response.text
@@ -0,0 +1,502 @@
+import os
+import shutil
+import zipfile
+
+from fnmatch import fnmatch
+from functools import partial
+from http import HTTPStatus
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+from ujenkins.exceptions import JenkinsError
+from ujenkins.helpers import StreamWriter, normalize_url, preallocate_file
+
+
+class BuildArtifacts:
+    """
+    Artifacts of builds, base class of ``Builds`` endpoint.
+    """
+    # implemented by Builds
+    get_info = None  # type: Any
+
+    def __init__(self, jenkins) -> None:
+        self.jenkins = jenkins
+
+    def _get_job_path(self, name: str) -> str:
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        return normalize_url(f'/{folder_name}/job/{job_name}')
+
+    def _get_build_path(self, name: str, build_id: Union[int, str], path: str) -> str:
+        return f'{self._get_job_path(name)}/{build_id}/{path}'
+
+    def get_artifact(self, name: str, build_id: Union[int, str], path: str) -> bytes:
+        """
+        Get artifact content of specified build.
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            path (str):
+                Relative path to build artifact, could be used from ``get_info()``
+                or ``get_list_artifacts()``, or just well known name.
+
+        Returns:
+            bytes: artifact content.
+        """
+        def callback(response) -> bytes:
+            return response.content
+
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        return self.jenkins._request(
+            'GET',
+            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/artifact/{path}'),
+            _callback=callback,
+        )
+
+    def _download_range(self,
+                        path: str,
+                        dest: Union[str, os.PathLike, BinaryIO],
+                        *,
+                        first: int = 0,
+                        last: Optional[int] = None,
+                        chunk_size: int,
+                        preallocate: bool,
+                        verify: bool
+                        ) -> Any:
+        """
+        Download bytes range of file (whole file by default), on connection
+        error download is resumed from last written byte using retry options
+        of client.
+        """
+        def step(writer: StreamWriter, offset: int) -> Any:
+            headers = {}
+            if offset or last is not None:
+                headers['Range'] = f'bytes={offset}-{"" if last is None else last}'
+
+            return self.jenkins._last(self.jenkins._stream(
+                'GET',
+                path,
+                headers=headers,
+                chunk_size=chunk_size,
+                _transform=writer,
+            ))
+
+        def fetch(state: tuple) -> Any:
+            _, offset = state
+            writers.append(StreamWriter(dest, preallocate=preallocate, verify=verify))
+
+            return self.jenkins._chain([
+                lambda _: step(writers[-1], offset),
+                lambda response: response,
+            ])
+
+        def process(response: Any, state: tuple) -> tuple:
+            attempt, offset = state
+
+            if not isinstance(response, JenkinsError):
+                return [response], None, 0
+
+            # file is already downloaded completely, if its size is confirmed
+            if response.status == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE and offset:
+                content_range = (response.headers or {}).get('Content-Range', '')
+                if content_range == f'bytes */{offset}':
+                    return [offset], None, 0
+
+            # only connection errors can be resumed and only for files
+            if (
+                response.status is not None or
+                attempt + 1 >= retry.get('total', 0) or
+                not isinstance(dest, (str, os.PathLike))
+            ):
+                raise response
+
+            position = max(offset, writers[-1].position)
+            return [], (attempt + 1, position), retry.get('factor', 1) * (2 ** attempt)
+
+        retry = self.jenkins._retry
+        writers = []  # type: List[StreamWriter]
+
+        return self.jenkins._last(self.jenkins._iterate(fetch, process, (0, first)))
+
+    def _download_segments(self,
+                           path: str,
+                           dest: Union[str, os.PathLike],
+                           *,
+                           segments: int,
+                           chunk_size: int,
+                           preallocate: bool,
+                           verify: bool
+                           ) -> Any:
+        """
+        Download file by parallel range requests, falls back to single
+        request if server doesn't support ranges.
+        """
+        def download_segment(segment: Tuple[int, int]) -> Any:
+            return self._download_range(
+                path,
+                dest,
+                first=segment[0],
+                last=segment[1],
+                chunk_size=chunk_size,
+                preallocate=False,
+                verify=verify,
+            )
+
+        def callback1(_) -> Any:
+            return partial(
+                self.jenkins._request,
+                'HEAD',
+                path,
+                _callback=lambda response: response.headers,
+            )
+
+        def callback2(headers: Any) -> Any:
+            if isinstance(headers, JenkinsError):
+                raise headers
+
+            size.append(int(headers.get('Content-Length', 0)))
+
+            if 'bytes' not in headers.get('Accept-Ranges', '') or size[0] < segments:
+                return partial(
+                    self._download_range,
+                    path,
+                    dest,
+                    chunk_size=chunk_size,
+                    preallocate=preallocate,
+                    verify=verify,
+                )
+
+            with open(dest, 'wb') as f:
+                if preallocate:
+                    preallocate_file(f, size[0])
+                else:
+                    f.truncate(size[0])
+
+            step = -(-size[0] // segments)
+            ranges = [(i, min(i + step, size[0]) - 1) for i in range(0, size[0], step)]
+
+            return partial(self.jenkins.map, download_segment, ranges, concurrency=segments)
+
+        def callback3(response: Any) -> int:
+            if isinstance(response, JenkinsError):
+                raise response
+
+            if not isinstance(response, list):
+                return response
+
+            for result in response:
+                if isinstance(result, JenkinsError):
+                    raise result
+
+            return size[0]
+
+        size = []  # type: List[int]
+
+        return self.jenkins._chain([callback1, callback2, callback3])
+
+    def download_artifact(self,
+                          name: str,
+                          build_id: Union[int, str],
+                          path: str,
+                          dest: Union[str, os.PathLike, BinaryIO],
+                          *,
+                          chunk_size: int = 64 * 1024,
+                          preallocate: bool = False,
+                          verify: bool = True,
+                          resume: bool = False,
+                          segments: int = 1
+                          ) -> int:
+        """
+        Download artifact of specified build directly into file or binary
+        buffer by chunks, so artifact is never loaded into memory entirely.
+
+        If client has retry options then download interrupted by connection
+        error is continued from last written byte using HTTP range request.
+
+        Example:
+
+        .. code-block:: python
+
+            client.builds.download_artifact('job', 31, 'image.iso', '/tmp/image.iso')
+
+            with open('/tmp/image.iso', 'wb') as f:
+                client.builds.download_artifact('job', 31, 'image.iso', f)
+
+            # continue previous download, fetch by 4 connections in parallel
+            client.builds.download_artifact(
+                'job', 31, 'image.iso', '/tmp/image.iso', resume=True
+            )
+            client.builds.download_artifact(
+                'job', 31, 'image.iso', '/tmp/image.iso', segments=4
+            )
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            path (str):
+                Relative path to build artifact, could be used from ``get_info()``
+                or ``get_list_artifacts()``, or just well known name.
+
+            dest (Union[str, os.PathLike, BinaryIO]):
+                Path to file or writable binary object.
+
+            chunk_size (int):
+                Size of chunk to read from network in bytes.
+
+            preallocate (bool):
+                Reserve disk space by Content-Length before writing, has
+                effect only if path to file is passed (default: false).
+
+            verify (bool):
+                Check downloaded size with Content-Length (default: true).
+
+            resume (bool):
+                Continue download into existing partially downloaded file
+                instead of overwriting it (default: false). File extended to
+                full size by ``preallocate`` or ``segments`` is marked by
+                ``.incomplete`` file next to it until download is finished,
+                such file is downloaded again from the beginning.
+
+            segments (int):
+                Download file by number of parallel range requests, used only
+                if server supports ranges and path to file is passed
+                (default: 1).
+
+        Returns:
+            int: artifact size in bytes.
+
+        Raises:
+            JenkinsError: in case downloaded size doesn't match.
+        """
+        def callback1(_) -> Any:
+            if segments > 1 and isinstance(dest, (str, os.PathLike)):
+                return partial(
+                    self._download_segments,
+                    url,
+                    dest,
+                    segments=segments,
+                    chunk_size=chunk_size,
+                    preallocate=preallocate,
+                    verify=verify,
+                )
+
+            return partial(
+                self._download_range,
+                url,
+                dest,
+                first=first,
+                chunk_size=chunk_size,
+                preallocate=preallocate,
+                verify=verify,
+            )
+
+        def callback2(size: Any) -> int:
+            if isinstance(size, JenkinsError):
+                raise size
+
+            if marker is not None and os.path.exists(marker):
+                os.remove(marker)
+
+            return size
+
+        url = normalize_url(self._get_build_path(name, build_id, f'artifact/{path}'))
+
+        first = 0
+        marker = None
+
+        if isinstance(dest, (str, os.PathLike)):
+            # size of extended file doesn't show how many bytes are written
+            marker = os.fspath(dest) + '.incomplete'
+
+            if resume and os.path.exists(dest) and not os.path.exists(marker):
+                first = os.path.getsize(dest)
+
+            if preallocate or segments > 1:
+                with open(marker, 'wb'):
+                    pass
+
+        return self.jenkins._chain([callback1, callback2])
+
+    def get_list_artifacts(self, name: str, build_id: Union[int, str]) -> List[dict]:
+        """
+        Get list of build artifacts.
+
+        Example:
+
+            .. code-block:: python
+
+                [
+                    {
+                        'name': 'photo.jpg',
+                        'path': 'photo.jpg',
+                        'url': 'http://server/job/my_job/31/artifact/photo.jpg'
+                    }
+                ]
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+        Returns:
+            List[dict]: list of build artifacts.
+        """
+        def callback1(_) -> Any:
+            return partial(self.get_info, name, build_id)
+
+        def callback2(response: Any):
+            if isinstance(response, JenkinsError):
+                raise response
+
+            artifacts = []
+
+            for artifact in response['artifacts']:
+                artifacts.append({
+                    'name': artifact['fileName'],
+                    'path': artifact['relativePath'],
+                    'url': root_url + artifact['relativePath'],
+                })
+
+            return artifacts
+
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+
+        root_url = (
+            self.jenkins.host +
+            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/artifact/')
+        )
+
+        return self.jenkins._chain([callback1, callback2])
+
+    def download_artifacts(self,
+                           name: str,
+                           build_id: Union[int, str],
+                           dest_dir: Union[str, os.PathLike],
+                           *,
+                           include: Optional[str] = None,
+                           concurrency: int = 10,
+                           archive: bool = False
+                           ) -> Dict[str, Union[int, JenkinsError]]:
+        """
+        Download all (or filtered) artifacts of specified build into
+        directory, keeping their relative paths. Artifacts are downloaded
+        concurrently and streamed directly into files.
+
+        In case of many small artifacts use ``archive=True``, then all of them
+        are downloaded by one request as zip archive and extracted.
+
+        Example:
+
+        .. code-block:: python
+
+            client.builds.download_artifacts('job', 31, '/tmp/out', include='*.log')
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            dest_dir (Union[str, os.PathLike]):
+                Directory to save artifacts.
+
+            include (Optional[str]):
+                Glob pattern for artifact relative path, e.g. ``logs/*.txt``.
+
+            concurrency (int):
+                Maximum number of simultaneous downloads (default: 10).
+
+            archive (bool):
+                Download artifacts as one zip archive (default: false).
+
+        Returns:
+            Dict[str, Union[int, JenkinsError]]: artifact path and number of
+            written bytes, or error if artifact download is failed.
+        """
+        def get_dest(artifact_path: str) -> str:
+            root = os.path.normpath(dest_dir)
+            dest = os.path.normpath(os.path.join(root, artifact_path))
+            if os.path.commonpath([dest, root]) != root:
+                raise JenkinsError(f'Artifact path is outside of directory: {artifact_path}')
+
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            return dest
+
+        def get_archive_path() -> str:
+            return os.path.join(dest_dir, f'.{number[0]}.archive.zip')
+
+        def download(artifact_path: str) -> Any:
+            return self.download_artifact(name, number[0], artifact_path, get_dest(artifact_path))
+
+        def callback1(_) -> Any:
+            # symbolic build id is resolved once, so all artifacts are of one build
+            return partial(self.get_info, name, build_id, fields='number,artifacts[relativePath]')
+
+        def callback2(info: Any) -> Any:
+            if isinstance(info, JenkinsError):
+                raise info
+
+            number.append(info['number'])
+
+            for artifact in info['artifacts']:
+                if include is None or fnmatch(artifact['relativePath'], include):
+                    paths.append(artifact['relativePath'])
+
+            if not paths:
+                return []
+
+            if archive:
+                return partial(
+                    self.download_artifact,
+                    name,
+                    number[0],
+                    '*zip*/archive.zip',
+                    get_archive_path(),
+                )
+
+            return partial(self.jenkins.map, download, paths, concurrency=concurrency)
+
+        def callback3(response: Any) -> Dict[str, Union[int, JenkinsError]]:
+            if isinstance(response, JenkinsError):
+                raise response
+
+            if not archive or not paths:
+                return dict(zip(paths, response, strict=True))
+
+            result = {}  # type: Dict[str, Union[int, JenkinsError]]
+            wanted = set(paths)
+
+            try:
+                with zipfile.ZipFile(get_archive_path()) as zf:
+                    for info in zf.infolist():
+                        # all files are placed in `archive` folder
+                        artifact_path = info.filename.split('/', 1)[-1]
+                        if info.is_dir() or artifact_path not in wanted:
+                            continue
+
+                        with zf.open(info) as src, open(get_dest(artifact_path), 'wb') as dst:
+                            shutil.copyfileobj(src, dst)
+
+                        result[artifact_path] = info.file_size
+            finally:
+                os.remove(get_archive_path())
+
+            return result
+
+        paths = []  # type: List[str]
+        number = []  # type: List[int]
+
+        os.makedirs(dest_dir, exist_ok=True)
+
+        return self.jenkins._chain([callback1, callback2, callback3])
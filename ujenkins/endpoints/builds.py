@@ -1,13 +1,17 @@
 import json
+import time
 
 from functools import partial
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from ujenkins.exceptions import JenkinsError
-from ujenkins.helpers import normalize_url
+from ujenkins.endpoints.artifacts import BuildArtifacts
+from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from ujenkins.helpers import TextDecoder, build_tree, normalize_url
 
+BUILD_STATE_FIELDS = 'number,building,result,duration,estimatedDuration,timestamp'
 
-class Builds:
+
+class Builds(BuildArtifacts):
     """
     List of Jenkins tags which can be used insted of build_id number.
 
@@ -19,13 +23,79 @@ class Builds:
     - lastUnstableBuild
     - lastUnsuccessfulBuild
     """
-    def __init__(self, jenkins) -> None:
-        self.jenkins = jenkins
+    def _get_completed(self,
+                       name: str,
+                       build_id: Union[int, str],
+                       kind: str,
+                       fetch: Callable[[Union[int, str]], Any]
+                       ) -> Any:
+        """
+        Get build data through cache of completed builds (if enabled), symbolic
+        build id is resolved to number first, then data is requested and
+        stored only if build is not running.
+        """
+        cache = self.jenkins.build_cache
+        if cache is None:
+            return fetch(build_id)
+
+        job_url = self.jenkins.host + self._get_job_path(name)
+
+        number = int(build_id) if str(build_id).isdigit() else None
+        if number is not None:
+            value = cache.get(job_url, number, kind)
+            if value is not None:
+                return self.jenkins._chain([lambda _: value])
+
+        def store(number: int, value: Any) -> Any:
+            if isinstance(value, JenkinsError):
+                raise value
+
+            cache.set(job_url, number, kind, value)
+            return value
+
+        def callback1(_) -> Any:
+            if kind == 'info':
+                return partial(fetch, build_id)
+
+            # completed build could be already cached
+            info = cache.get(job_url, number, 'info') if number is not None else None
+            if info is not None:
+                return info
+
+            return partial(
+                self.jenkins._request,
+                'GET',
+                self._get_build_path(name, build_id, 'api/json'),
+                params={'tree': 'number,building'},
+            )
+
+        def callback2(info: Any) -> Any:
+            if isinstance(info, JenkinsError):
+                raise info
+
+            if info['building']:
+                if kind == 'info':
+                    return info
+                return partial(fetch, info['number'])
+
+            if kind == 'info':
+                return store(info['number'], info)
+
+            value = cache.get(job_url, info['number'], kind)
+            if value is not None:
+                return value
+
+            return partial(self.jenkins._chain, [
+                lambda _: partial(fetch, info['number']),
+                partial(store, info['number']),
+            ])
+
+        return self.jenkins._chain([callback1, callback2])
 
     def get(self,
             name: str,
             *,
-            fields: Optional[List[str]] = None,
+            fields: Optional[Union[str, list, dict]] = None,
             start: Optional[int] = None,
             end: Optional[int] = None
             ) -> List[dict]:
@@ -71,8 +141,10 @@ class Builds:
             name (str):
                 Job name or path (if in folder).
 
-            fields (Optional[List]):
-                List of fields to return.
+            fields (Optional[Union[str, list, dict]]):
+                List of fields to return, nested fields could be specified by
+                dict, e.g. ``['number', {'artifacts': ['fileName']}]``, see
+                ``ujenkins.helpers.build_tree``.
                 Possible values are mentioned in the available fields.
                 If empty, default fields will be returned.
 
@@ -91,7 +163,7 @@ class Builds:
         """
 
         def callback(response) -> List[dict]:
-            return json.loads(response.text)['allBuilds']
+            return self.jenkins._parse_json(response)['allBuilds']
 
         pagination = ''
         if end is not None or start is not None:
@@ -101,7 +173,7 @@ class Builds:
 
         folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
 
-        fields_str = ','.join(fields) if fields else 'number,url'
+        fields_str = build_tree(fields) if fields else 'number,url'
         return self.jenkins._request(
             'GET',
             normalize_url(
@@ -111,7 +183,78 @@ class Builds:
             _callback=callback,
         )
 
-    def get_info(self, name: str, build_id: Union[int, str]) -> dict:
+    def iter(self,
+             name: str,
+             *,
+             fields: Optional[Union[str, list, dict]] = None,
+             page_size: int = 100,
+             prefetch: bool = False
+             ) -> Iterator[dict]:
+        """
+        Iterate over builds of specified job from newest to oldest, builds are
+        requested lazily by pages, so memory usage doesn't depend on history
+        size. For async client it returns async iterator.
+
+        Builds started during iteration shift pages, so already returned builds
+        are skipped by number, which is always requested.
+
+        Example:
+
+        .. code-block:: python
+
+            for build in client.builds.iter('job', fields=['number', 'result']):
+                print(build)
+
+            async for build in client.builds.iter('job', prefetch=True):
+                print(build)
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return, see ``get()``, default is number and url.
+
+            page_size (int):
+                Number of builds requested at once (default: 100).
+
+            prefetch (bool):
+                Request next page in background while current one is consumed
+                (default: false).
+
+        Returns:
+            Iterator[dict]: builds of specified job.
+        """
+        if page_size <= 0:
+            raise JenkinsError('Invalid `page_size` argument must be > 0')
+
+        def fetch(state: tuple) -> Any:
+            return self.get(name, fields=tree, start=state[0], end=state[0] + page_size)
+
+        def process(page: List[dict], state: tuple) -> tuple:
+            start, last = state
+            builds = [b for b in page if last is None or b['number'] < last]
+
+            if builds:
+                last = builds[-1]['number']
+
+            if len(page) < page_size:
+                return builds, None, 0
+
+            return builds, (start + page_size, last), 0
+
+        tree = build_tree(fields) if fields else 'number,url'
+        if 'number' not in tree.split(','):
+            tree = 'number,' + tree
+
+        return self.jenkins._iterate(fetch, process, (0, None), prefetch)
+
+    def get_info(self,
+                 name: str,
+                 build_id: Union[int, str],
+                 *,
+                 fields: Optional[Union[str, list, dict]] = None
+                 ) -> dict:
         """
         Get detailed information about specified build number of job.
 
@@ -122,15 +265,26 @@ class Builds:
             build_id (int):
                 Build number or some of standard tags like `lastBuild`.
 
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return instead of full representation, e.g.
+                ``['result', {'artifacts': ['relativePath']}]``, see
+                ``ujenkins.helpers.build_tree``. Partial information isn't
+                stored in cache of completed builds.
+
         Returns:
             dict: information about build.
         """
-        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        def fetch(build_id: Union[int, str]) -> Any:
+            return self.jenkins._request('GET', self._get_build_path(name, build_id, 'api/json'))
 
-        return self.jenkins._request(
-            'GET',
-            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/api/json')
-        )
+        if fields:
+            return self.jenkins._request(
+                'GET',
+                self._get_build_path(name, build_id, 'api/json'),
+                params={'tree': build_tree(fields)},
+            )
+
+        return self._get_completed(name, build_id, 'info', fetch)
 
     def get_output(self, name: str, build_id: Union[int, str]) -> str:
         """
@@ -146,17 +300,84 @@ class Builds:
         Returns:
             str: build output.
         """
+        def fetch(build_id: Union[int, str]) -> Any:
+            return self.jenkins._request(
+                'GET',
+                self._get_build_path(name, build_id, 'consoleText'),
+                _callback=self.jenkins._return_text,
+            )
+
+        return self._get_completed(name, build_id, 'output', fetch)
+
+    def iter_output(self,
+                    name: str,
+                    build_id: Union[int, str],
+                    *,
+                    chunk_size: int = 64 * 1024,
+                    lines: bool = False
+                    ) -> Iterator[str]:
+        """
+        Iterate over console output of specified build without loading whole
+        log into memory. For async client it returns async iterator.
+
+        Example:
+
+        .. code-block:: python
+
+            for line in client.builds.iter_output('job', 1, lines=True):
+                print(line)
+
+            async for line in client.builds.iter_output('job', 1, lines=True):
+                print(line)
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            build_id (int):
+                Build number or some of standard tags like `lastBuild`.
+
+            chunk_size (int):
+                Size of chunk to read from network in bytes.
+
+            lines (bool):
+                Yield lines without line endings instead of text chunks.
+
+        Returns:
+            Iterator[str]: build output chunks or lines.
+        """
         folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
 
-        return self.jenkins._request(
+        return self.jenkins._stream(
             'GET',
             normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/consoleText'),
-            _callback=self.jenkins._return_text,
+            chunk_size=chunk_size,
+            _transform=TextDecoder(lines),
         )
 
-    def get_artifact(self, name: str, build_id: Union[int, str], path: str) -> bytes:
+    def tail_output(self,
+                    name: str,
+                    build_id: Union[int, str],
+                    *,
+                    start: int = 0,
+                    lines: bool = False,
+                    interval: float = 1,
+                    max_interval: float = 10
+                    ) -> Iterator[str]:
         """
-        Get artifact content of specified build.
+        Follow console output of running build, only new part of log is
+        requested each time using progressive text API, iteration stops when
+        build is finished. For async client it returns async iterator.
+
+        Poll interval is doubled each time when no new output appeared, up to
+        ``max_interval``, and reset back when output is growing.
+
+        Example:
+
+        .. code-block:: python
+
+            for line in client.builds.tail_output('job', 'lastBuild', lines=True):
+                print(line)
 
         Args:
             name (str):
@@ -165,40 +386,82 @@ class Builds:
             build_id (int):
                 Build number or some of standard tags like `lastBuild`.
 
-            path (str):
-                Relative path to build artifact, could be used from ``get_info()``
-                or ``get_list_artifacts()``, or just well known name.
+            start (int):
+                Byte offset in log to start from (default: 0).
+
+            lines (bool):
+                Yield lines without line endings instead of text chunks.
+
+            interval (float):
+                Initial poll interval in seconds (default: 1).
+
+            max_interval (float):
+                Maximum poll interval in seconds (default: 10).
 
         Returns:
-            bytes: artifact content.
+            Iterator[str]: build output chunks or lines.
         """
-        def callback(response) -> bytes:
-            return response.content
+        def callback(response) -> Any:
+            return response
 
-        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        def fetch(state: tuple) -> Any:
+            return self.jenkins._request(
+                'GET',
+                path,
+                params={'start': state[0]},
+                _callback=callback,
+                _fresh=True,
+            )
 
-        return self.jenkins._request(
-            'GET',
-            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/artifact/{path}'),
-            _raw_content=True,
-            _callback=callback,
+        def process(response: Any, state: tuple) -> tuple:
+            offset, delay = state
+            items = decoder.feed(response.content)
+
+            if response.headers.get('X-More-Data') != 'true':
+                return items + decoder.flush(), None, 0
+
+            offset = int(response.headers.get('X-Text-Size', offset + len(response.content)))
+
+            if response.content:
+                delay = interval
+            else:
+                delay = min(delay * 2, max_interval)
+
+            return items, (offset, delay), delay
+
+        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        path = normalize_url(
+            f'/{folder_name}/job/{job_name}/{build_id}/logText/progressiveText'
         )
 
-    def get_list_artifacts(self, name: str, build_id: Union[int, str]) -> List[dict]:
+        decoder = TextDecoder(lines)
+
+        return self.jenkins._iterate(fetch, process, (start, interval))
+
+    def wait(self,
+             name: str,
+             build_id: Union[int, str],
+             *,
+             timeout: Optional[float] = None,
+             interval: float = 1,
+             max_interval: float = 30
+             ) -> dict:
         """
-        Get list of build artifacts.
+        Wait until build is completed. State of build is polled using minimal
+        projection, poll interval is adapted to build estimated duration: half
+        of estimated remaining time while build is expected to finish, and
+        growing with elapsed time when it's overdue.
+
+        Async client uses one poller per job for all simultaneous waits, so
+        thousands of waits cost one request per poll, parameters of the first
+        wait are used by shared poller.
 
         Example:
 
-            .. code-block:: python
+        .. code-block:: python
 
-                [
-                    {
-                        'name': 'photo.jpg',
-                        'path': 'photo.jpg',
-                        'url': 'http://server/job/my_job/31/artifact/photo.jpg'
-                    }
-                ]
+            build = client.builds.wait('job', 31, timeout=3600)
+            print(build['result'])
 
         Args:
             name (str):
@@ -207,33 +470,89 @@ class Builds:
             build_id (int):
                 Build number or some of standard tags like `lastBuild`.
 
+            timeout (Optional[float]):
+                Maximum time to wait in seconds, not limited by default.
+
+            interval (float):
+                Minimal poll interval in seconds (default: 1).
+
+            max_interval (float):
+                Maximal poll interval in seconds (default: 30).
+
         Returns:
-            List[dict]: list of build artifacts.
+            dict: build number, result, building, duration, estimatedDuration
+            and timestamp.
+
+        Raises:
+            JenkinsError: in case of timeout.
         """
-        def callback1(_) -> Any:
-            return partial(self.get_info, name, build_id)
+        state = {'last': 0}
 
-        def callback2(response: Any):
-            if isinstance(response, JenkinsError):
-                raise response
+        def callback(response: Any) -> Dict[int, dict]:
+            data = self.jenkins._parse_json(response)
+            state['last'] = (data.get('lastBuild') or {}).get('number', 0)
+            return {build['number']: build for build in data['allBuilds']}
 
-            artifacts = []
+        def fetch(numbers: List[int]) -> Any:
+            # builds are sorted from newest, so waited ones are within range
+            size = max(10, state['last'] - min(numbers) + 1)
 
-            for artifact in response['artifacts']:
-                artifacts.append({
-                    'name': artifact['fileName'],
-                    'path': artifact['relativePath'],
-                    'url': root_url + artifact['relativePath'],
-                })
+            return self.jenkins._request(
+                'GET',
+                path + '/api/json',
+                params={'tree': f'lastBuild[number],allBuilds[{BUILD_STATE_FIELDS}]{{0,{size}}}'},
+                _callback=callback,
+                _fresh=True,
+            )
 
-            return artifacts
+        def check(builds: Dict[int, dict], number: int) -> Tuple[bool, Any]:
+            build = builds.get(number)
+            if build is not None:
+                return not build['building'], build
 
-        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+            if number > state['last'] or (builds and number > min(builds)):
+                return True, JenkinsNotFoundError(f'Build `{name}` #{number} is not found')
 
-        root_url = (
-            self.jenkins.host +
-            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/artifact/')
-        )
+            # too old build, range of next request is enlarged
+            return False, None
+
+        def get_delay(builds: Dict[int, dict], numbers: List[int]) -> float:
+            now = time.time() * 1000
+            delays = []
+
+            for number in numbers:
+                build = builds.get(number)
+                if build is None or not build['building']:
+                    continue
+
+                remaining = build['timestamp'] + build['estimatedDuration'] - now
+                if build['estimatedDuration'] > 0 and remaining > 0:
+                    delays.append(remaining / 2 / 1000)
+                else:
+                    delays.append((now - build['timestamp']) / 10 / 1000)
+
+            return min(max(min(delays, default=interval), interval), max_interval)
+
+        def callback1(_) -> Any:
+            if str(build_id).isdigit():
+                return {'number': int(build_id)}
+            return partial(self.get_info, name, build_id, fields='number')
+
+        def callback2(build: Any) -> Any:
+            if isinstance(build, JenkinsError):
+                raise build
+
+            return partial(
+                self.jenkins._poll,
+                path,
+                build['number'],
+                fetch=fetch,
+                check=check,
+                get_delay=get_delay,
+                timeout=timeout,
+            )
+
+        path = self._get_job_path(name)
 
         return self.jenkins._chain([callback1, callback2])
 
@@ -332,6 +651,151 @@ class Builds:
             _callback=callback,
         )
 
+    def start_and_get_number(self,
+                             name: str,
+                             parameters: Optional[Any] = None,
+                             delay: int = 0,
+                             *,
+                             timeout: Optional[float] = None,
+                             interval: float = 1,
+                             **kwargs: Any
+                             ) -> int:
+        """
+        Enqueue new build and wait until it's started, see ``start()`` and
+        ``queue.wait()``, async client uses one shared poller of queue for
+        all simultaneous calls.
+
+        Example:
+
+        .. code-block:: python
+
+            numbers = await asyncio.gather(*[
+                client.builds.start_and_get_number('job', parameters={'n': n})
+                for n in range(100)
+            ])
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            parameters (Optional[Any]):
+                Parameters of triggering build, see ``start()``.
+
+            delay (int):
+                Delay before start, default is 0, no delay.
+
+            timeout (Optional[float]):
+                Maximum time to wait for build start in seconds, not limited
+                by default.
+
+            interval (float):
+                Poll interval of queue in seconds (default: 1).
+
+        Returns:
+            int: build number.
+
+        Raises:
+            JenkinsError: in case of timeout or queue item is cancelled.
+        """
+        def callback1(_) -> Any:
+            return partial(self.start, name, parameters, delay, **kwargs)
+
+        def callback2(queue_id: Any) -> Any:
+            if isinstance(queue_id, JenkinsError):
+                raise queue_id
+
+            if queue_id is None:
+                raise JenkinsError('Queue item id isn`t returned by server')
+
+            return partial(self.jenkins.queue.wait, queue_id, timeout=timeout, interval=interval)
+
+        def callback3(executable: Any) -> int:
+            if isinstance(executable, JenkinsError):
+                raise executable
+
+            return executable['number']
+
+        return self.jenkins._chain([callback1, callback2, callback3])
+
+    def start_and_wait(self,
+                       name: str,
+                       parameters: Optional[Any] = None,
+                       delay: int = 0,
+                       *,
+                       timeout: Optional[float] = None,
+                       interval: float = 1,
+                       max_interval: float = 30,
+                       **kwargs: Any
+                       ) -> dict:
+        """
+        Enqueue new build and wait until it's completed, see
+        ``start_and_get_number()`` and ``wait()``.
+
+        Example:
+
+        .. code-block:: python
+
+            build = client.builds.start_and_wait('job', timeout=3600, branch='main')
+            print(build['number'], build['result'])
+
+        Args:
+            name (str):
+                Job name or path (if in folder).
+
+            parameters (Optional[Any]):
+                Parameters of triggering build, see ``start()``.
+
+            delay (int):
+                Delay before start, default is 0, no delay.
+
+            timeout (Optional[float]):
+                Maximum time to wait including time in queue in seconds, not
+                limited by default.
+
+            interval (float):
+                Minimal poll interval in seconds (default: 1).
+
+            max_interval (float):
+                Maximal poll interval of build in seconds (default: 30).
+
+        Returns:
+            dict: build number, result and other fields, see ``wait()``.
+
+        Raises:
+            JenkinsError: in case of timeout or queue item is cancelled.
+        """
+        def callback1(_) -> Any:
+            return partial(
+                self.start_and_get_number,
+                name,
+                parameters,
+                delay,
+                timeout=timeout,
+                interval=interval,
+                **kwargs,
+            )
+
+        def callback2(number: Any) -> Any:
+            if isinstance(number, JenkinsError):
+                raise number
+
+            remaining = None
+            if timeout is not None:
+                remaining = max(timeout - (time.monotonic() - started), 0)
+
+            return partial(
+                self.wait,
+                name,
+                number,
+                timeout=remaining,
+                interval=interval,
+                max_interval=max_interval,
+            )
+
+        started = time.monotonic()
+
+        return self.jenkins._chain([callback1, callback2])
+
     def stop(self, name: str, build_id: Union[int, str]) -> None:
         """
         Stop specified build.
@@ -367,9 +831,12 @@ class Builds:
         Returns:
             None
         """
-        folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+        if self.jenkins.build_cache is not None:
+            job_url = self.jenkins.host + self._get_job_path(name)
+            if str(build_id).isdigit():
+                self.jenkins.build_cache.delete(job_url, int(build_id))
+            else:
+                # symbolic id, not known which build will be deleted
+                self.jenkins.build_cache.delete(job_url)
 
-        return self.jenkins._request(
-            'POST',
-            normalize_url(f'/{folder_name}/job/{job_name}/{build_id}/doDelete')
-        )
+        return self.jenkins._request('POST', self._get_build_path(name, build_id, 'doDelete'))
@@ -1,10 +1,8 @@
-import json
-
 from functools import partial
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from ujenkins.exceptions import JenkinsNotFoundError
-from ujenkins.helpers import normalize_url
+from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
+from ujenkins.helpers import build_tree, normalize_url
 
 
 class Jobs:
@@ -41,7 +39,7 @@ class Jobs:
         """
         def callback(response):
             all_jobs = {}
-            jobs = json.loads(response.text)['jobs']
+            jobs = self.jenkins._parse_json(response)['jobs']
             for job in jobs:
                 all_jobs[job['name']] = job
 
@@ -60,7 +58,130 @@ class Jobs:
             _callback=callback,
         )
 
-    def get_info(self, name: str) -> dict:
+    def walk(self,
+             root: str = '',
+             *,
+             fields: Optional[Union[str, list, dict]] = None,
+             max_depth: Optional[int] = None,
+             depth: int = 3,
+             concurrency: int = 10
+             ) -> Iterator[Tuple[str, dict]]:
+        """
+        Iterate over all jobs and folders recursively with full names. Each
+        request fetches several levels of folders using nested tree query,
+        deeper folders are requested concurrently. In case of error (e.g.
+        server can't handle too big response) folder is requested again level
+        by level. For async client it returns async iterator.
+
+        Example:
+
+        .. code-block:: python
+
+            for full_name, job in client.jobs.walk(fields=['color']):
+                print(full_name, job['color'])
+
+            async for full_name, job in client.jobs.walk('folder', max_depth=2):
+                print(full_name, job['url'])
+
+        Args:
+            root (str):
+                Folder name or path to start from, by default root is used.
+
+            fields (Optional[Union[str, list, dict]]):
+                Additional fields of job, ``name`` and ``url`` are always
+                included, see ``ujenkins.helpers.build_tree``.
+
+            max_depth (Optional[int]):
+                Maximum folder nesting level relative to root, ``1`` means
+                only jobs of root folder, not limited by default.
+
+            depth (int):
+                Folder levels fetched by one request (default: 3).
+
+            concurrency (int):
+                Maximum number of simultaneous requests (default: 10).
+
+        Returns:
+            Iterator[Tuple[str, dict]]: full job name and job properties,
+            without nested jobs.
+        """
+        if depth <= 0:
+            raise JenkinsError('Invalid `depth` argument must be > 0')
+
+        if max_depth is not None and max_depth <= 0:
+            raise JenkinsError('Invalid `max_depth` argument must be > 0')
+
+        def get_levels(level: int) -> int:
+            if max_depth is None:
+                return depth
+            return min(depth, max_depth - level + 1)
+
+        def get_tree(levels: int, boundary: bool) -> str:
+            item = ['name', 'url', fields]  # type: List[Any]
+            # names of children show that item is folder, which isn't fetched
+            spec = {'jobs': item + [{'jobs': 'name'} if boundary else None]}
+            for _ in range(levels - 1):
+                spec = {'jobs': item + [spec]}
+            return build_tree(spec)
+
+        def request(folder: tuple) -> Any:
+            name, level, levels = folder
+            folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
+            path = normalize_url(f'/{folder_name}/job/{job_name}') if name else ''
+            boundary = max_depth is None or level + levels <= max_depth
+
+            return self.jenkins._request(
+                'GET',
+                path + '/api/json',
+                params={'tree': get_tree(levels, boundary)},
+            )
+
+        def flatten(jobs: List[dict], prefix: str, level: int, levels: int) -> None:
+            for job in jobs:
+                full_name = prefix + job['name']
+                children = job.pop('jobs', None)
+                items.append((full_name, job))
+
+                if not children:
+                    continue
+
+                if levels > 1:
+                    flatten(children, full_name + '/', level + 1, levels - 1)
+                elif max_depth is None or level < max_depth:
+                    pending.append((full_name, level + 1, get_levels(level + 1)))
+
+        def fetch(folders: List[tuple]) -> Any:
+            return self.jenkins.map(request, folders, concurrency=concurrency)
+
+        def process(results: List[Any], folders: List[tuple]) -> tuple:
+            items.clear()
+            pending.clear()
+
+            for folder, result in zip(folders, results, strict=True):
+                name, level, levels = folder
+
+                if isinstance(result, JenkinsError):
+                    if levels == 1 or isinstance(result, JenkinsNotFoundError):
+                        raise result
+                    pending.append((name, level, 1))
+                    continue
+
+                flatten(result['jobs'], name + '/' if name else '', level, levels)
+
+            return list(items), list(pending) or None, 0
+
+        items = []  # type: List[Tuple[str, dict]]
+        pending = []  # type: List[tuple]
+
+        root = root.strip('/')
+
+        return self.jenkins._iterate(fetch, process, [(root, 1, get_levels(1))])
+
+    def get_info(self,
+                 name: str,
+                 *,
+                 fields: Optional[Union[str, list, dict]] = None
+                 ) -> dict:
         """
         Get detailed information of specified job.
 
@@ -68,6 +189,11 @@ class Jobs:
             name (str):
                 Job name.
 
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return instead of full representation, e.g.
+                ``['name', {'lastBuild': ['number']}]``, see
+                ``ujenkins.helpers.build_tree``.
+
         Returns:
             dict: job information.
         """
@@ -75,7 +201,8 @@ class Jobs:
 
         return self.jenkins._request(
             'GET',
-            normalize_url(f'/{folder_name}/job/{job_name}/api/json')
+            normalize_url(f'/{folder_name}/job/{job_name}/api/json'),
+            params={'tree': build_tree(fields)} if fields else None,
         )
 
     def get_config(self, name: str) -> str:
@@ -189,6 +316,11 @@ class Jobs:
         """
         folder_name, job_name = self.jenkins._get_folder_and_job_name(name)
 
+        if self.jenkins.build_cache is not None:
+            self.jenkins.build_cache.delete(
+                self.jenkins.host + normalize_url(f'/{folder_name}/job/{job_name}')
+            )
+
         return self.jenkins._request(
             'POST',
             normalize_url(f'/{folder_name}/job/{job_name}/doDelete')
@@ -242,6 +374,11 @@ class Jobs:
             'newName': new_name
         }
 
+        if self.jenkins.build_cache is not None:
+            self.jenkins.build_cache.delete(
+                self.jenkins.host + normalize_url(f'/{folder_name}/job/{job_name}')
+            )
+
         return self.jenkins._request(
             'POST',
             normalize_url(f'/{folder_name}/job/{job_name}/doRename'),
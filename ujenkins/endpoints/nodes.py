@@ -2,10 +2,11 @@ import json
 import xml.etree.ElementTree
 
 from functools import partial
-from typing import Any, Dict, List
+from http import HTTPStatus
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from ujenkins.exceptions import JenkinsError, JenkinsNotFoundError
-from ujenkins.helpers import parse_build_url
+from ujenkins.helpers import build_tree, parse_build_url
 
 
 def _parse_rss(rss: str) -> List[dict]:
@@ -28,6 +29,102 @@ def _parse_rss(rss: str) -> List[dict]:
     return list(reversed(builds))
 
 
+NODE_SNAPSHOT_FIELDS = [
+    'displayName',
+    'offline',
+    'temporarilyOffline',
+    'idle',
+    'numExecutors',
+    {'assignedLabels': 'name', 'executors': 'idle'},
+]
+
+
+class NodesSnapshot:
+    """
+    Nodes state at some moment with indexes for fast lookups, see
+    ``Nodes.snapshot()``.
+
+    Attributes:
+        nodes (Dict[str, dict]):
+            Node name and its properties.
+
+        labels (Dict[str, List[str]]):
+            Label and names of nodes which have it, node name is label too.
+
+        offline (List[str]):
+            Names of offline nodes.
+
+        idle_executors (Dict[str, int]):
+            Node name and number of its idle executors, only online nodes
+            with idle executors are included.
+    """
+    def __init__(self, nodes: List[dict]) -> None:
+        self.nodes = {}  # type: Dict[str, dict]
+        self.labels = {}  # type: Dict[str, List[str]]
+        self.offline = []  # type: List[str]
+        self.idle_executors = {}  # type: Dict[str, int]
+
+        for node in nodes:
+            name = node['displayName']
+            self.nodes[name] = node
+
+            for label in node.get('assignedLabels', []):
+                self.labels.setdefault(label['name'], []).append(name)
+
+            if node.get('offline'):
+                self.offline.append(name)
+                continue
+
+            idle = sum(1 for e in node.get('executors', []) if e.get('idle'))
+            if idle:
+                self.idle_executors[name] = idle
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nodes)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.nodes
+
+    def __getitem__(self, name: str) -> dict:
+        return self.nodes[name]
+
+    def find(self,
+             label: Optional[str] = None,
+             *,
+             offline: Optional[bool] = None,
+             min_idle: int = 0
+             ) -> List[str]:
+        """
+        Find nodes by label, state and number of idle executors.
+
+        Args:
+            label (Optional[str]):
+                Label which node should have.
+
+            offline (Optional[bool]):
+                Offline state of node, any by default.
+
+            min_idle (int):
+                Minimal number of idle executors, if set only online nodes
+                are returned.
+
+        Returns:
+            List[str]: names of found nodes.
+        """
+        names = list(self.labels.get(label, []) if label is not None else self.nodes)
+
+        if offline is not None:
+            names = [n for n in names if bool(self.nodes[n].get('offline')) is offline]
+
+        if min_idle > 0:
+            names = [n for n in names if self.idle_executors.get(n, 0) >= min_idle]
+
+        return names
+
+
 class Nodes:
 
     def __init__(self, jenkins) -> None:
@@ -40,10 +137,16 @@ class Nodes:
             return '(master)'
         return name
 
-    def get(self) -> Dict[str, dict]:
+    def get(self, *, fields: Optional[Union[str, list, dict]] = None) -> Dict[str, dict]:
         """
         Get all available nodes on server.
 
+        Args:
+            fields (Optional[Union[str, list, dict]]):
+                Fields of node to return instead of full representation, e.g.
+                ``['offline', {'executors': ['idle']}]``, ``displayName`` is
+                always included, see ``ujenkins.helpers.build_tree``.
+
         Returns:
             Dict[str, dict]: node name, and it`s detailed information.
 
@@ -57,13 +160,65 @@ class Nodes:
             }
 
         """
+        return self._get(fields)
+
+    def _get(self, fields: Optional[Union[str, list, dict]], fresh: bool = False) -> Any:
         def callback(response):
-            nodes = json.loads(response.text)
+            nodes = self.jenkins._parse_json(response)
             return {v['displayName']: v for v in nodes['computer']}
 
+        params = None
+        if fields:
+            params = {'tree': build_tree({'computer': ['displayName', fields]})}
+
         return self.jenkins._request(
             'GET',
             '/computer/api/json',
+            params=params,
+            _callback=callback,
+            _fresh=fresh,
+        )
+
+    def _get_offline(self, name: str) -> Any:
+        # state is read bypassing cache, otherwise node could be toggled back
+        return self.jenkins._request(
+            'GET',
+            f'/computer/{name}/api/json',
+            params={'tree': 'temporarilyOffline'},
+            _fresh=True,
+        )
+
+    def snapshot(self, *, fields: Optional[Union[str, list, dict]] = None) -> NodesSnapshot:
+        """
+        Get state of all nodes by one projected request, with indexes by
+        label, offline state and number of idle executors.
+
+        Example:
+
+        .. code-block:: python
+
+            snapshot = client.nodes.snapshot()
+            names = snapshot.find('linux', min_idle=1)
+
+        Args:
+            fields (Optional[Union[str, list, dict]]):
+                Additional fields of node, by default only fields required for
+                indexes are requested: displayName, offline,
+                temporarilyOffline, idle, numExecutors, assignedLabels and
+                executors, see ``ujenkins.helpers.build_tree``.
+
+        Returns:
+            NodesSnapshot: nodes and indexes.
+        """
+        def callback(response) -> NodesSnapshot:
+            return NodesSnapshot(self.jenkins._parse_json(response)['computer'])
+
+        tree = build_tree({'computer': NODE_SNAPSHOT_FIELDS + [fields]})
+
+        return self.jenkins._request(
+            'GET',
+            '/computer/api/json',
+            params={'tree': tree},
             _callback=callback,
         )
 
@@ -133,7 +288,11 @@ class Nodes:
             _callback=callback
         )
 
-    def get_info(self, name: str) -> dict:
+    def get_info(self,
+                 name: str,
+                 *,
+                 fields: Optional[Union[str, list, dict]] = None
+                 ) -> dict:
         """
         Get node detailed information.
 
@@ -141,16 +300,28 @@ class Nodes:
             name (str):
                 Node name.
 
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return instead of full representation, e.g.
+                ``['offline', 'offlineCauseReason']``, see
+                ``ujenkins.helpers.build_tree``.
+
         Returns:
             dict: detailed node information.
         """
         def callback1(_):
-            return self.jenkins._request('GET', f'/computer/{name}/api/json')
+            return self.jenkins._request(
+                'GET',
+                f'/computer/{name}/api/json',
+                params={'tree': build_tree(fields)} if fields else None,
+            )
 
         def callback2(response: Any):
             if isinstance(response, JenkinsError):
                 return response
 
+            if 'offline' not in response or 'temporarilyOffline' not in response:
+                return response
+
             response['_disconnected'] = (
                 response['offline'] is True and
                 response['temporarilyOffline'] is False
@@ -205,7 +376,7 @@ class Nodes:
 
         return self.jenkins._chain([callback1, callback2])
 
-    def create(self, name: str, config: dict) -> None:
+    def create(self, name: str, config: dict, *, check: bool = True) -> None:
         """
         Create new node.
 
@@ -216,37 +387,107 @@ class Nodes:
             config (dict):
                 Config for new node, see ujenkins.helpers.construct_node_config
 
+            check (bool):
+                Check that node doesn`t exist by light request before creation,
+                otherwise 400 response of server saying that node already
+                exists is reported as existing node (default: true).
+
         Returns:
             None
 
         Raises:
             JenkinsError: in case node already exists.
         """
-        def callback1(_) -> Any:
-            return partial(self.get)
-
-        def callback2(response: Any) -> bool:
-            # if not check, then we get 400 error with unclear stacktrace
-            if name in response:
-                raise JenkinsError(f'Node `{name}` is already exists')
-
-            if 'type' not in config:
-                config['type'] = 'hudson.slaves.DumbSlave'
-
-            config['name'] = name
+        def create(_) -> Any:
+            node_config = {'type': 'hudson.slaves.DumbSlave', **config, 'name': name}
 
             params = {
                 'name': name,
-                'type': config['type'],
-                'json': json.dumps(config)
+                'type': node_config['type'],
+                'json': json.dumps(node_config)
             }
 
-            return self.jenkins._request(
+            return partial(
+                self.jenkins._request,
                 'POST',
                 '/computer/doCreateItem',
                 params=params,
             )
 
+        def callback1(_) -> Any:
+            return partial(self.get_info, name, fields='displayName')
+
+        def callback2(response: Any) -> Any:
+            if not isinstance(response, JenkinsNotFoundError):
+                if isinstance(response, JenkinsError):
+                    raise response
+
+                raise JenkinsError(f'Node `{name}` is already exists')
+
+            return create(response)
+
+        def callback3(response: Any) -> None:
+            if isinstance(response, JenkinsError):
+                # without check existing node leads to 400 with HTML page,
+                # other 400 reasons (e.g. invalid name) keep server message
+                if (not check and response.status == HTTPStatus.BAD_REQUEST
+                        and 'already exists' in (response.message or '')):
+                    raise JenkinsError(
+                        f'Node `{name}` is already exists',
+                        status=response.status,
+                    )
+                raise response
+
+        if not check:
+            return self.jenkins._chain([create, callback3])
+
+        return self.jenkins._chain([callback1, callback2, callback3])
+
+    def create_many(self,
+                    configs: Dict[str, dict],
+                    *,
+                    concurrency: int = 10,
+                    check: bool = True
+                    ) -> Dict[str, Optional[JenkinsError]]:
+        """
+        Create many nodes concurrently, see ``create()``.
+
+        Example:
+
+        .. code-block:: python
+
+            client.nodes.create_many(
+                {f'agent-{i}': construct_node_config() for i in range(100)},
+                concurrency=20,
+            )
+
+        Args:
+            configs (Dict[str, dict]):
+                Node name and its config.
+
+            concurrency (int):
+                Maximum number of simultaneous requests (default: 10).
+
+            check (bool):
+                Check that node doesn`t exist before creation (default: true).
+
+        Returns:
+            Dict[str, Optional[JenkinsError]]: node name and None if it's
+            created or error.
+        """
+        def create(item: Tuple[str, dict]) -> Any:
+            return self.create(*item, check=check)
+
+        def callback1(_) -> Any:
+            items = list(configs.items())
+            return partial(self.jenkins.map, create, items, concurrency=concurrency)
+
+        def callback2(results: Any) -> Dict[str, Optional[JenkinsError]]:
+            if isinstance(results, JenkinsError):
+                raise results
+
+            return dict(zip(configs, results, strict=True))
+
         return self.jenkins._chain([callback1, callback2])
 
     def delete(self, name: str) -> None:
@@ -307,7 +548,7 @@ class Nodes:
         name = self._normalize_name(name)
 
         def callback1(_) -> Any:
-            return partial(self.get_info, name)
+            return partial(self._get_offline, name)
 
         def callback2(response: dict) -> None:
             # skip if already enabled
@@ -335,7 +576,7 @@ class Nodes:
         name = self._normalize_name(name)
 
         def callback1(_) -> Any:
-            return partial(self.get_info, name)
+            return partial(self._get_offline, name)
 
         def callback2(response: dict) -> None:
             # skip if already disabled
@@ -350,6 +591,82 @@ class Nodes:
 
         return self.jenkins._chain([callback1, callback2])
 
+    def set_offline_many(self,
+                         names: List[str],
+                         offline: bool,
+                         message: str = '',
+                         *,
+                         concurrency: int = 10
+                         ) -> Dict[str, Optional[JenkinsError]]:
+        """
+        Disable or enable many nodes concurrently. State of all nodes is read
+        by one projected request and only nodes in other state are toggled.
+
+        Example:
+
+        .. code-block:: python
+
+            client.nodes.set_offline_many(['agent-1', 'agent-2'], True, 'maintenance')
+
+        Args:
+            names (List[str]):
+                Node names.
+
+            offline (bool):
+                Disable nodes if true, otherwise enable.
+
+            message (str):
+                Reason message, used only for disabling.
+
+            concurrency (int):
+                Maximum number of simultaneous requests (default: 10).
+
+        Returns:
+            Dict[str, Optional[JenkinsError]]: node name and None if it's in
+            required state or error.
+        """
+        def toggle(name: str) -> Any:
+            return self.jenkins._request(
+                'POST',
+                f'/computer/{self._normalize_name(name)}/toggleOffline',
+                params={'offlineMessage': message} if offline else None,
+            )
+
+        def callback1(_) -> Any:
+            return partial(self._get, 'temporarilyOffline', fresh=True)
+
+        def callback2(response: Any) -> Any:
+            if isinstance(response, JenkinsError):
+                raise response
+
+            nodes = {self._normalize_name(k): v for k, v in response.items()}
+
+            # duplicates and aliases of built-in node must be toggled once
+            for name in dict.fromkeys(map(self._normalize_name, names)):
+                node = nodes.get(name)
+                if node is None:
+                    results[name] = JenkinsNotFoundError(f'Node `{name}` not found')
+                elif node['temporarilyOffline'] is offline:
+                    results[name] = None
+                else:
+                    pending.append(name)
+
+            return partial(self.jenkins.map, toggle, pending, concurrency=concurrency)
+
+        def callback3(toggled: Any) -> Dict[str, Optional[JenkinsError]]:
+            if isinstance(toggled, JenkinsError):
+                raise toggled
+
+            for name, result in zip(pending, toggled, strict=True):
+                results[name] = result if isinstance(result, JenkinsError) else None
+
+            return {name: results[self._normalize_name(name)] for name in names}
+
+        results = {}  # type: dict[str, Optional[JenkinsError]]
+        pending = []  # type: List[str]
+
+        return self.jenkins._chain([callback1, callback2, callback3])
+
     def update_offline_reason(self, name: str, message: str) -> None:
         """
         Update reason message of disabled node.
@@ -1,6 +1,6 @@
-import json
+from typing import Dict, Optional, Union
 
-from typing import Dict
+from ujenkins.helpers import build_tree
 
 
 class Plugins:
@@ -8,19 +8,37 @@ class Plugins:
     def __init__(self, jenkins) -> None:
         self.jenkins = jenkins
 
-    def get(self, depth: int = 2) -> Dict[str, dict]:
+    def get(self,
+            depth: int = 2,
+            *,
+            fields: Optional[Union[str, list, dict]] = None
+            ) -> Dict[str, dict]:
         """
         Get dict of all existed plugins in the system.
 
+        Args:
+            depth (int):
+                Depth of plugin properties (default: 2), ignored if fields
+                are specified.
+
+            fields (Optional[Union[str, list, dict]]):
+                Fields of plugin to return instead of full representation,
+                e.g. ``['version', 'active']``, ``shortName`` is always
+                included, see ``ujenkins.helpers.build_tree``.
+
         Returns:
             Dict[str, dict] - plugin name and plugin properties.
         """
         def callback(response) -> Dict[str, dict]:
-            plugins = json.loads(response.text)['plugins']
+            plugins = self.jenkins._parse_json(response)['plugins']
             return {p['shortName']: p for p in plugins}
 
+        path = f'/pluginManager/api/json?depth={depth}'
+        if fields:
+            path = '/pluginManager/api/json?tree=' + build_tree({'plugins': ['shortName', fields]})
+
         return self.jenkins._request(
             'GET',
-            f'/pluginManager/api/json?depth={depth}',
+            path,
             _callback=callback,
         )
@@ -1,6 +1,15 @@
-import json
+import re
 
-from typing import Dict
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ujenkins.exceptions import JenkinsError
+from ujenkins.helpers import build_tree
+
+QUEUE_ITEM_FIELDS = 'id,why,blocked,buildable,stuck,inQueueSince,task[name,url]'
+
+# countdowns in reason of waiting, e.g. "In the quiet period. Expires in 4.9 sec"
+TIME_SPAN_RE = re.compile(r'\d+(\.\d+)? (ms|sec|min|hr|days?|mo|yr)\b')
 
 
 class Queue:
@@ -8,24 +17,137 @@ class Queue:
     def __init__(self, jenkins) -> None:
         self.jenkins = jenkins
 
-    def get(self) -> Dict[int, dict]:
+    def get(self, *, fields: Optional[Union[str, list, dict]] = None) -> Dict[int, dict]:
         """
         Get server queue.
 
+        Args:
+            fields (Optional[Union[str, list, dict]]):
+                Fields of queue item to return instead of full representation,
+                e.g. ``['why', {'task': ['name']}]``, ``id`` is always
+                included, see ``ujenkins.helpers.build_tree``.
+
         Returns:
             Dict[int, dict]: id item in queue, and it's detailed information.
         """
+        return self._get(fields)
+
+    def _get(self, fields: Optional[Union[str, list, dict]], fresh: bool = False) -> Any:
         def callback(response):
-            items = json.loads(response.text)['items']
+            items = self.jenkins._parse_json(response)['items']
             return {item['id']: item for item in items}
 
+        params = None
+        if fields:
+            params = {'tree': build_tree({'items': ['id', fields]})}
+
         return self.jenkins._request(
             'GET',
             '/queue/api/json',
+            params=params,
             _callback=callback,
+            _fresh=fresh,
         )
 
-    def get_info(self, item_id: int) -> dict:
+    def get_many(self,
+                 item_ids: Iterable[int],
+                 *,
+                 fields: Optional[Union[str, list, dict]] = None
+                 ) -> Dict[int, Optional[dict]]:
+        """
+        Get info about many enqueued items from one queue snapshot.
+
+        Args:
+            item_ids (Iterable[int]):
+                enqueued items identifiers.
+
+            fields (Optional[Union[str, list, dict]]):
+                Fields of queue item to return, see ``get()``.
+
+        Returns:
+            Dict[int, Optional[dict]]: item identifier and its information,
+            or None if item already left queue.
+        """
+        def callback1(_) -> Any:
+            return partial(self.get, fields=fields)
+
+        def callback2(queue: Any) -> Dict[int, Optional[dict]]:
+            if isinstance(queue, JenkinsError):
+                raise queue
+
+            return {i: queue.get(i) for i in item_ids}
+
+        item_ids = list(item_ids)
+
+        return self.jenkins._chain([callback1, callback2])
+
+    def watch(self,
+              *,
+              interval: float = 1,
+              fields: Optional[Union[str, list, dict]] = None
+              ) -> Iterator[Dict[str, Dict[int, dict]]]:
+        """
+        Follow queue changes, queue is polled with minimal projection and
+        only differences with previous state are yielded: added items,
+        removed items (left queue or cancelled) and changed items, e.g.
+        reason of blocking (``why``) is changed, countdowns in reason like
+        quiet period expiration are ignored. First event contains all
+        items as added. Iteration is endless. For async client it returns
+        async iterator.
+
+        Example:
+
+        .. code-block:: python
+
+            for event in client.queue.watch(interval=5):
+                for item_id, item in event['changed'].items():
+                    print(item_id, item['why'])
+
+        Args:
+            interval (float):
+                Poll interval in seconds (default: 1).
+
+            fields (Optional[Union[str, list, dict]]):
+                Fields of queue item to compare and return, by default: id,
+                why, blocked, buildable, stuck, inQueueSince and task name
+                and url.
+
+        Returns:
+            Iterator[Dict[str, Dict[int, dict]]]: changes, dict with keys
+            ``added``, ``removed``, ``changed`` and values are items by
+            identifier.
+        """
+        def fetch(_) -> Any:
+            return self._get(fields or QUEUE_ITEM_FIELDS, fresh=True)
+
+        def normalize(item: dict) -> dict:
+            if isinstance(item.get('why'), str):
+                return {**item, 'why': TIME_SPAN_RE.sub('?', item['why'])}
+
+            return item
+
+        def process(queue: Dict[int, dict], previous: Dict[int, dict]) -> tuple:
+            event = {
+                'added': {k: v for k, v in queue.items() if k not in previous},
+                'removed': {k: v for k, v in previous.items() if k not in queue},
+                'changed': {
+                    k: v for k, v in queue.items()
+                    if k in previous and normalize(previous[k]) != normalize(v)
+                },
+            }
+
+            if any(event.values()):
+                return [event], queue, interval
+
+            return [], queue, interval
+
+        return self.jenkins._iterate(fetch, process, {})
+
+    def get_info(self,
+                 item_id: int,
+                 *,
+                 fields: Optional[Union[str, list, dict]] = None
+                 ) -> dict:
         """
         Get info about enqueued item (build) identifier.
 
@@ -33,12 +155,110 @@ class Queue:
             item_id (int):
                 enqueued item identifier.
 
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return instead of full representation, e.g.
+                ``['why', {'executable': ['number']}]``, see
+                ``ujenkins.helpers.build_tree``.
+
         Returns:
             dict: identifier information.
         """
         return self.jenkins._request(
             'GET',
             f'/queue/item/{item_id}/api/json',
+            params={'tree': build_tree(fields)} if fields else None,
+        )
+
+    def wait(self,
+             item_id: int,
+             *,
+             timeout: Optional[float] = None,
+             interval: float = 1
+             ) -> dict:
+        """
+        Wait until enqueued item leaves queue and build is started.
+
+        Async client uses one poller for all simultaneous waits, which reads
+        whole queue by one request, and requests only items which left queue.
+
+        Args:
+            item_id (int):
+                enqueued item identifier.
+
+            timeout (Optional[float]):
+                Maximum time to wait in seconds, not limited by default.
+
+            interval (float):
+                Poll interval in seconds (default: 1).
+
+        Returns:
+            dict: started build number and url.
+
+        Raises:
+            JenkinsError: in case of timeout or item is cancelled.
+        """
+        def callback(response: Any) -> set:
+            return {item['id'] for item in self.jenkins._parse_json(response)['items']}
+
+        def callback1(_) -> Any:
+            return partial(
+                self.jenkins._request,
+                'GET',
+                '/queue/api/json',
+                params={'tree': 'items[id]'},
+                _callback=callback,
+                _fresh=True,
+            )
+
+        def get_item(item_id: int) -> Any:
+            return self.jenkins._request(
+                'GET',
+                f'/queue/item/{item_id}/api/json',
+                params={'tree': 'cancelled,executable[number,url]'},
+                _fresh=True,
+            )
+
+        def fetch(item_ids: List[int]) -> Any:
+            def callback2(queue: Any) -> Any:
+                if isinstance(queue, JenkinsError):
+                    raise queue
+
+                left.extend(i for i in item_ids if i not in queue)
+                if not left:
+                    return []
+
+                return partial(self.jenkins.map, get_item, left)
+
+            def callback3(items: Any) -> Dict[int, Any]:
+                if isinstance(items, JenkinsError):
+                    raise items
+
+                return dict(zip(left, items, strict=True))
+
+            left = []  # type: List[int]
+            return self.jenkins._chain([callback1, callback2, callback3])
+
+        def check(items: Dict[int, Any], item_id: int) -> Tuple[bool, Any]:
+            item = items.get(item_id)
+            if item is None:
+                return False, None
+
+            if isinstance(item, JenkinsError):
+                return True, item
+
+            if item.get('cancelled'):
+                return True, JenkinsError(f'Queue item {item_id} is cancelled')
+
+            executable = item.get('executable')
+            return executable is not None, executable
+
+        return self.jenkins._poll(
+            '/queue',
+            item_id,
+            fetch=fetch,
+            check=check,
+            get_delay=lambda *_: interval,
+            timeout=timeout,
         )
 
     def cancel(self, item_id: int) -> None:
@@ -57,3 +277,67 @@ class Queue:
             '/queue/cancelItem',
             params={'id': item_id},
         )
+
+    def cancel_many(self,
+                    items: Union[Iterable[int], Callable[[dict], bool]],
+                    *,
+                    concurrency: int = 10,
+                    fields: Optional[Union[str, list, dict]] = None
+                    ) -> Dict[int, Optional[JenkinsError]]:
+        """
+        Cancel many enqueued items concurrently. Items could be selected by
+        identifiers or by predicate, which is evaluated against one queue
+        snapshot.
+
+        Example:
+
+        .. code-block:: python
+
+            client.queue.cancel_many(
+                lambda item: item['task']['url'].startswith('http://server/job/folder/'),
+                concurrency=50,
+            )
+
+        Args:
+            items (Union[Iterable[int], Callable[[dict], bool]]):
+                Identifiers of items or function which accepts queue item and
+                returns True if item should be cancelled.
+
+            concurrency (int):
+                Maximum number of simultaneous requests (default: 10).
+
+            fields (Optional[Union[str, list, dict]]):
+                Fields of queue item passed to predicate, by default: id, why,
+                blocked, buildable, stuck, inQueueSince, params and task name
+                and url.
+
+        Returns:
+            Dict[int, Optional[JenkinsError]]: item identifier and None if
+            it's cancelled or error.
+        """
+        def callback1(_) -> Any:
+            if not callable(items):
+                return list(items)
+
+            return partial(self.get, fields=fields or QUEUE_ITEM_FIELDS + ',params')
+
+        def callback2(queue: Any) -> Any:
+            if isinstance(queue, JenkinsError):
+                raise queue
+
+            if isinstance(queue, dict):
+                item_ids.extend(k for k, v in queue.items() if items(v))  # type: ignore[operator]
+            else:
+                item_ids.extend(queue)
+
+            return partial(self.jenkins.map, self.cancel, item_ids, concurrency=concurrency)
+
+        def callback3(results: Any) -> Dict[int, Optional[JenkinsError]]:
+            if isinstance(results, JenkinsError):
+                raise results
+
+            return dict(zip(item_ids, results, strict=True))
+
+        item_ids = []  # type: List[int]
+
+        return self.jenkins._chain([callback1, callback2, callback3])
@@ -1,8 +1,7 @@
-import json
-
-from typing import NamedTuple, Tuple
+from typing import NamedTuple, Optional, Tuple, Union
 
 from ujenkins.exceptions import JenkinsError
+from ujenkins.helpers import build_tree
 
 
 class JenkinsVersion(NamedTuple):
@@ -17,14 +16,24 @@ class System:
     def __init__(self, jenkins) -> None:
         self.jenkins = jenkins
 
-    def get_status(self) -> dict:
+    def get_status(self, *, fields: Optional[Union[str, list, dict]] = None) -> dict:
         """
         Get server status.
 
+        Args:
+            fields (Optional[Union[str, list, dict]]):
+                Fields to return instead of full representation, e.g.
+                ``['mode', {'jobs': ['name']}]``, see
+                ``ujenkins.helpers.build_tree``.
+
         Returns:
             dict: jenkins server details.
         """
-        return self.jenkins._request('GET', '/api/json')
+        return self.jenkins._request(
+            'GET',
+            '/api/json',
+            params={'tree': build_tree(fields)} if fields else None,
+        )
 
     def get_version(self) -> JenkinsVersion:
         """
@@ -113,7 +122,7 @@ class System:
                              tokenUuid - uses for revoke
         """
         def callback(response):
-            content = json.loads(response.text)
+            content = self.jenkins._parse_json(response)
 
             if content['status'] != 'ok':
                 raise JenkinsError('Non OK status returned: ' + str(content))
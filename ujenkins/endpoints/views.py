@@ -1,5 +1,3 @@
-import json
-
 from typing import Dict
 
 from ujenkins.exceptions import JenkinsError
@@ -18,7 +16,7 @@ class Views:
             Dict[str, dict]: plugin name and plugin properties.
         """
         def callback(response):
-            views = json.loads(response.text)['views']
+            views = self.jenkins._parse_json(response)['views']
             return {v['name']: v for v in views}
 
         return self.jenkins._request(
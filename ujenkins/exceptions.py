@@ -2,10 +2,11 @@ class JenkinsError(Exception):
     """
     Core library exception
     """
-    def __init__(self, message=None, status=None):
+    def __init__(self, message=None, status=None, headers=None):
         super().__init__(message)
         self.message = message
         self.status = status
+        self.headers = headers
 
 
 class JenkinsNotFoundError(JenkinsError):
@@ -1,6 +1,8 @@
+import codecs
+import os
 import re
 
-from typing import List, Optional, Tuple
+from typing import IO, Any, BinaryIO, List, Optional, Tuple, Union
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -10,6 +12,10 @@ JOB_BUILD_URL_RE = re.compile(
     r'/job/(?P<job_name>.+)/(?P<build_number>\d+)'
 )
 
+CONTENT_RANGE_RE = re.compile(
+    r'bytes (?P<start>\d+)-(?P<end>\d+)/(?P<total>\d+|\*)'
+)
+
 
 def _construct_commands_block(parent, commands: List[str]) -> None:
     SubElement(parent, 'command').text = '\n'.join(commands)
@@ -177,3 +183,198 @@ def normalize_url(path: str) -> str:
     if path.startswith('//'):
         return path[1:]
     return path
+
+
+def build_tree(fields: Union[str, list, dict]) -> str:
+    """
+    Compile fields specification to value of Jenkins ``tree`` query
+    parameter, which limits returned data to selected fields.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> build_tree(['number', 'result', {'artifacts': ['fileName']}])
+        'number,result,artifacts[fileName]'
+
+        >>> build_tree({'jobs{0,10}': ['name', {'lastBuild': 'number'}]})
+        'jobs{0,10}[name,lastBuild[number]]'
+
+    Args:
+        fields (Union[str, list, dict]):
+            Field name or ready tree string, list of fields, or dict of field
+            name and its nested fields specification.
+
+    Returns:
+        str: tree parameter value.
+    """
+    if isinstance(fields, str):
+        return fields
+
+    if isinstance(fields, dict):
+        return ','.join(
+            f'{name}[{build_tree(nested)}]' if nested else name
+            for name, nested in fields.items()
+        )
+
+    return ','.join(build_tree(field) for field in fields if field)
+
+
+class StreamTransform:
+    """
+    Base transform of streamed response body, passes chunks as is.
+
+    Adapters call begin() with response headers, then feed() for each
+    chunk and flush() at the end, items returned by feed() and flush() are
+    yielded to caller. close() is called in any case, even on error.
+    """
+    def begin(self, headers: Any) -> None:
+        pass
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        return [chunk]
+
+    def flush(self) -> List[Any]:
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+class TextDecoder(StreamTransform):
+    """
+    Incremental decoder of streamed bytes into text chunks or lines.
+
+    Args:
+        lines (bool):
+            Return lines without line endings instead of text chunks.
+
+        encoding (str):
+            Text encoding (default: utf-8).
+    """
+    def __init__(self, lines: bool = False, encoding: str = 'utf-8') -> None:
+        self.lines = lines
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self.buffer = ''
+
+    def _split(self, text: str) -> List[str]:
+        if not self.lines:
+            return [text] if text else []
+
+        parts = (self.buffer + text).split('\n')
+        self.buffer = parts.pop()
+
+        return [part.rstrip('\r') for part in parts]
+
+    def feed(self, chunk: bytes) -> List[str]:
+        return self._split(self.decoder.decode(chunk))
+
+    def flush(self) -> List[str]:
+        items = self._split(self.decoder.decode(b'', final=True))
+
+        if self.lines and self.buffer:
+            items.append(self.buffer.rstrip('\r'))
+            self.buffer = ''
+
+        return items
+
+
+class StreamWriter(StreamTransform):
+    """
+    Writes streamed bytes into file or writable binary buffer, flush returns
+    position in file after last written byte.
+
+    Partial response (with Content-Range header) is written into existing
+    file starting from range offset, which allows to resume downloads and
+    download file by segments.
+
+    Args:
+        dest (Union[str, os.PathLike, BinaryIO]):
+            Path to file or writable binary object.
+
+        preallocate (bool):
+            Reserve disk space for file by Content-Length before writing.
+
+        verify (bool):
+            Raise ``JenkinsError`` if written size doesn't match
+            Content-Length header.
+    """
+    def __init__(self,
+                 dest: Union[str, os.PathLike, BinaryIO],
+                 *,
+                 preallocate: bool = False,
+                 verify: bool = True
+                 ) -> None:
+        self.dest = dest
+        self.preallocate = preallocate
+        self.verify = verify
+        self.file = None  # type: Any
+        self.size = None  # type: Optional[int]
+        self.offset = 0
+        self.written = 0
+
+    @property
+    def position(self) -> int:
+        return self.offset + self.written
+
+    def begin(self, headers: Any) -> None:
+        # for compressed body Content-Length is size on the wire
+        if 'Content-Length' in headers and 'Content-Encoding' not in headers:
+            self.size = int(headers['Content-Length'])
+
+        match = CONTENT_RANGE_RE.match(headers.get('Content-Range', ''))
+        if match:
+            self.offset = int(match.group('start'))
+
+        if not isinstance(self.dest, (str, os.PathLike)):
+            self.file = self.dest
+            if self.offset:
+                self.file.seek(self.offset)
+            return
+
+        if match and os.path.exists(self.dest):
+            self.file = open(self.dest, 'r+b')  # pylint: disable=consider-using-with
+            self.file.seek(self.offset)
+            return
+
+        self.file = open(self.dest, 'wb')  # pylint: disable=consider-using-with
+        if self.preallocate and self.size:
+            preallocate_file(self.file, self.offset + self.size)
+            self.file.seek(self.offset)
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        self.file.write(chunk)
+        self.written += len(chunk)
+        return []
+
+    def flush(self) -> List[int]:
+        if self.verify and self.size is not None and self.written != self.size:
+            raise JenkinsError(
+                f'Incomplete download, expected {self.size} bytes, got {self.written}'
+            )
+
+        return [self.position]
+
+    def close(self) -> None:
+        if self.file is not None and self.file is not self.dest:
+            self.file.close()
+
+
+def preallocate_file(file: IO, size: int) -> None:
+    """
+    Reserve disk space for file.
+
+    Args:
+        file (IO):
+            File opened for writing.
+
+        size (int):
+            File size in bytes.
+
+    Returns:
+        None
+    """
+    if hasattr(os, 'posix_fallocate'):
+        os.posix_fallocate(file.fileno(), 0, size)
+    else:
+        file.truncate(size)